@@ -1,6 +1,9 @@
+use std::fmt::Write as _;
+use std::io::Write as _;
+use std::process::{Command, Stdio};
 use std::sync::{LazyLock, OnceLock};
 
-use convert_case::{Case, Casing};
+use convert_case::{Case, Converter};
 use crates_common::{diagnostic, Pos, Span};
 use crates_toml::container::{Container, Toml};
 use crates_toml::map::{
@@ -11,14 +14,29 @@ use crates_toml::parse::AssocPos;
 use crates_toml::{MapTable, TomlDiagnostics};
 use indexmap::IndexMap;
 
-const INPUT_PATH: &str = "crates/krilla/src/interchange/tagging/generate.toml";
-const OUTPUT_PATH: &str = "crates/krilla/src/interchange/tagging/generated.rs";
+// Resolved relative to this crate, so the generator works from any directory.
+const INPUT_PATH: &str = concat!(
+    env!("CARGO_MANIFEST_DIR"),
+    "/../crates/krilla/src/interchange/tagging/generate.toml"
+);
+const OUTPUT_PATH: &str = concat!(
+    env!("CARGO_MANIFEST_DIR"),
+    "/../crates/krilla/src/interchange/tagging/generated.rs"
+);
 const HEADER: &str = "\
 // This file is automatically generated!
 //
 // To update it:
 // 1. Edit the `generate.toml` file inside of this directory
-// 2. Run `cargo run --bin=codegen` from the repository root
+// 2. Run `cargo run --bin=codegen` from anywhere inside the repository
+//    (this requires `rustfmt` to be installed)
+
+";
+
+/// The closing part of an `impl Ordinal` block.
+const ORDINAL_IMPL_END: &str = "        }
+    }
+}
 
 ";
 
@@ -30,14 +48,27 @@ struct Tag<'a> {
 struct TagVariant<'a> {
     comments: Vec<&'a str>,
     name: &'a str,
-    required: Vec<(&'a Attr<'a>, &'a AttrVariant<'a>)>,
-    optional: Vec<(&'a Attr<'a>, &'a AttrVariant<'a>)>,
-    suggested: Vec<(&'a Attr<'a>, &'a AttrVariant<'a>)>,
+    required: Vec<AttrRef<'a>>,
+    optional: Vec<AttrRef<'a>>,
+    suggested: Vec<AttrRef<'a>>,
+    docs: OnceLock<&'a str>,
+}
+
+impl TagVariant<'_> {
+    fn docs(&self) -> &str {
+        self.docs.get_or_init(|| doc_comment(&self.comments))
+    }
+}
+
+/// A specific variant of an attribute kind, as referenced by a tag.
+struct AttrRef<'a> {
+    kind: &'a Attr<'a>,
+    variant: &'a AttrVariant<'a>,
 }
 
 struct Attr<'a> {
     name: &'a str,
-    variants: Vec<AttrVariant<'a>>,
+    variants: IndexMap<&'a str, AttrVariant<'a>>,
     field: OnceLock<&'a str>,
     struct_name: OnceLock<&'a str>,
 }
@@ -50,7 +81,7 @@ impl Attr<'_> {
 
     fn accessor_name(&self) -> &str {
         self.field
-            .get_or_init(|| self.name.to_case(Case::Snake).leak())
+            .get_or_init(|| SNAKE_CASE.convert(self.name).leak())
     }
 }
 
@@ -67,17 +98,20 @@ struct AttrVariant<'a> {
     param_mapping: OnceLock<&'a str>,
     ret_type: OnceLock<&'a str>,
     ret_mapping: OnceLock<&'a str>,
+    docs: OnceLock<&'a str>,
+    setter_comment: OnceLock<&'a str>,
+    optional_tag_accessors: OnceLock<&'a str>,
 }
 
 impl AttrVariant<'_> {
     fn accessor_name(&self) -> &str {
         self.accessor_name
-            .get_or_init(|| self.name.to_case(Case::Snake).leak())
+            .get_or_init(|| SNAKE_CASE.convert(self.name).leak())
     }
 
     fn ordinal_name(&self) -> &str {
         self.ordinal_name
-            .get_or_init(|| self.name.to_case(Case::UpperSnake).leak())
+            .get_or_init(|| UPPER_SNAKE_CASE.convert(self.name).leak())
     }
 
     fn param_type(&self) -> &str {
@@ -143,6 +177,38 @@ impl AttrVariant<'_> {
             },
         })
     }
+
+    fn docs(&self) -> &str {
+        self.docs.get_or_init(|| doc_comment(&self.comments))
+    }
+
+    /// The doc comment of the setter, rendered once and shared by all
+    /// `set_*` and `with_*` accessors of this variant.
+    fn setter_comment(&self) -> &str {
+        self.setter_comment.get_or_init(|| {
+            let mut buf = String::new();
+            // Every entry is documented, see `comment_lines`.
+            let line = self.comments[0].trim_start();
+            let first = line.chars().next().unwrap();
+            let remainder = &line[first.len_utf8()..];
+            writeln!(buf, "/// Set {}{remainder}", first.to_lowercase()).ok();
+            for comment in self.comments.iter().skip(1) {
+                writeln!(buf, "///{comment}").ok();
+            }
+            buf.leak()
+        })
+    }
+
+    /// The accessors of this variant as an optional tag specific attribute.
+    /// These are the same for every tag that supports it, so they are only
+    /// generated once.
+    fn optional_tag_accessors(&self, attr_kind: &Attr) -> &str {
+        self.optional_tag_accessors.get_or_init(|| {
+            let mut buf = String::new();
+            write_accessors(&mut buf, attr_kind, self, false, true, TagImpl::Tag);
+            buf.leak()
+        })
+    }
 }
 
 #[derive(Default, PartialEq, Eq)]
@@ -154,6 +220,11 @@ enum AccessorKind<'a> {
     Custom,
 }
 
+// Case converters are set up once instead of for every converted name.
+static SNAKE_CASE: LazyLock<Converter> = LazyLock::new(|| Converter::new().to_case(Case::Snake));
+static UPPER_SNAKE_CASE: LazyLock<Converter> =
+    LazyLock::new(|| Converter::new().to_case(Case::UpperSnake));
+
 static TOML: LazyLock<&Toml> = LazyLock::new(|| {
     let input = std::fs::read_to_string(INPUT_PATH).unwrap();
     let mut ctx = TomlDiagnostics::default();
@@ -226,12 +297,15 @@ fn parse_attr<'a>(name: &'a str, attr: &'a MapTable<'a>) -> Attr<'a> {
             param_mapping: OnceLock::new(),
             ret_type: OnceLock::new(),
             ret_mapping: OnceLock::new(),
+            docs: OnceLock::new(),
+            setter_comment: OnceLock::new(),
+            optional_tag_accessors: OnceLock::new(),
         }
     });
 
     Attr {
         name,
-        variants: variants.collect(),
+        variants: variants.map(|v| (v.name, v)).collect(),
         field: OnceLock::new(),
         struct_name: OnceLock::new(),
     }
@@ -254,6 +328,7 @@ fn parse_tag() -> Tag<'static> {
             required: required.unwrap_or_default(),
             optional: optional.unwrap_or_default(),
             suggested: suggested.unwrap_or_default(),
+            docs: OnceLock::new(),
         }
     });
 
@@ -264,7 +339,10 @@ fn parse_tag() -> Tag<'static> {
 }
 
 fn main() {
-    let mut output = String::new();
+    // The previous output is a good estimate for the size of the new one, so
+    // the whole file can be built without reallocating and written at once.
+    let previous = std::fs::read(OUTPUT_PATH).unwrap_or_default();
+    let mut output = String::with_capacity(previous.len());
     output.push_str(HEADER);
 
     write_tag_kind(&mut output);
@@ -275,12 +353,40 @@ fn main() {
         ordinal_offset += attr.variants.len();
     }
 
-    std::fs::write(OUTPUT_PATH, &output).unwrap();
+    let output = rustfmt(&output);
+    // Leave the file untouched if nothing changed, so that its modification
+    // time is preserved and cargo doesn't needlessly rebuild krilla.
+    if output != previous {
+        std::fs::write(OUTPUT_PATH, output).unwrap();
+    }
 }
 
-fn attribute_array(
-    entry: &MapTableEntry<'_>,
-) -> Vec<(&'static Attr<'static>, &'static AttrVariant<'static>)> {
+/// Formats the generated code by piping it through `rustfmt`, so the
+/// generator doesn't have to get every line break and indentation right.
+fn rustfmt(code: &str) -> Vec<u8> {
+    let mut child = Command::new("rustfmt")
+        .args(["--edition", "2021", "--emit", "stdout"])
+        .stdin(Stdio::piped())
+        .stdout(Stdio::piped())
+        .spawn()
+        .expect("failed to run rustfmt");
+
+    // Feed stdin from a separate thread, so a full stdout pipe can't block us.
+    // A failed write means rustfmt exited early, which is reported through
+    // its exit status below.
+    let mut stdin = child.stdin.take().unwrap();
+    let output = std::thread::scope(|s| {
+        s.spawn(move || stdin.write_all(code.as_bytes()).ok());
+        child.wait_with_output().unwrap()
+    });
+    if !output.status.success() {
+        println!("rustfmt failed to format the generated code");
+        std::process::exit(1);
+    }
+    output.stdout
+}
+
+fn attribute_array(entry: &MapTableEntry<'_>) -> Vec<AttrRef<'static>> {
     let array = entry.expect_inline_array();
     let attrs = array.iter().map(|e| {
         let Some((attr_kind, attr_variant)) = e.expect_str().split_once("::") else {
@@ -297,64 +403,85 @@ fn attribute_array(
             );
         };
 
-        let variant = attr
-            .variants
-            .iter()
-            .find(|v| v.name == attr_variant)
-            .unwrap_or_else(|| {
-                report_error(
-                    &format!("Unknown attribute variant `{attr_kind}::{attr_variant}`"),
-                    e.repr.span(),
-                );
-            });
-
-        (attr, variant)
+        let Some(variant) = attr.variants.get(attr_variant) else {
+            report_error(
+                &format!("Unknown attribute variant `{attr_kind}::{attr_variant}`"),
+                e.repr.span(),
+            );
+        };
+
+        AttrRef {
+            kind: attr,
+            variant,
+        }
     });
     attrs.collect()
 }
 
 fn write_tag_kind(f: &mut impl std::fmt::Write) {
-    for comment in TAG.comments.iter() {
-        writeln!(f, "///{comment}").ok();
-    }
+    f.write_str(doc_comment(&TAG.comments)).ok();
     writeln!(f, "#[derive(Clone, Debug, PartialEq)]").ok();
     writeln!(f, "pub enum TagKind {{").ok();
-    for TagVariant { name, comments, .. } in TAG.variants.iter() {
-        for comment in comments.iter() {
-            writeln!(f, "    ///{comment}").ok();
-        }
+    for variant @ TagVariant { name, .. } in TAG.variants.iter() {
+        f.write_str(variant.docs()).ok();
         writeln!(f, "    {name}(Tag<kind::{name}>),").ok();
     }
     writeln!(f, "}}").ok();
     writeln!(f).ok();
 
-    writeln!(f, "impl TagKind {{").ok();
-    #[rustfmt::skip]
-    writeln!(f, "    /// A type erased tag, which allows reading all attributes.").ok();
-    writeln!(f, "    pub fn as_any(&self) -> &AnyTag {{").ok();
-    writeln!(f, "        match self {{").ok();
+    write!(
+        f,
+        "\
+impl TagKind {{
+    /// A type erased tag, which allows reading all attributes.
+    #[inline]
+    pub fn as_any(&self) -> &AnyTag {{
+        match self {{
+"
+    )
+    .ok();
     for TagVariant { name, .. } in TAG.variants.iter() {
         writeln!(f, "            Self::{name}(tag) => tag.as_any(),").ok();
     }
-    writeln!(f, "        }}").ok();
-    writeln!(f, "    }}").ok();
-    writeln!(f).ok();
-    #[rustfmt::skip]
-    writeln!(f, "    /// A type erased tag, which allows reading all attributes and additionally").ok();
-    writeln!(f, "    /// writing all global attributes.").ok();
-    writeln!(f, "    pub fn as_any_mut(&mut self) -> &mut AnyTag {{").ok();
-    writeln!(f, "        match self {{").ok();
+    write!(
+        f,
+        "        }}
+    }}
+
+    /// A type erased tag, which allows reading all attributes and additionally
+    /// writing all global attributes.
+    #[inline]
+    pub fn as_any_mut(&mut self) -> &mut AnyTag {{
+        match self {{
+"
+    )
+    .ok();
     for TagVariant { name, .. } in TAG.variants.iter() {
         writeln!(f, "            Self::{name}(tag) => tag.as_any_mut(),").ok();
     }
-    writeln!(f, "        }}").ok();
-    writeln!(f, "    }}").ok();
-
-    // Accessors for `TagKind`.
+    write!(
+        f,
+        "        }}
+    }}
+"
+    )
+    .ok();
+
+    // Accessors for `TagKind`, `AnyTag` and global accessors for `Tag<T>` are
+    // all produced in a single pass over the attributes. The latter two are
+    // buffered until their impl blocks are written.
+    let mut any_accessors = String::new();
+    let mut global_accessors = String::new();
     for attr_kind in ATTRS.values() {
-        for attr_variant in attr_kind.variants.iter() {
+        for attr_variant in attr_kind.variants.values() {
             let write = attr_variant.global;
             write_accessors(f, attr_kind, attr_variant, false, write, TagImpl::TagKind);
+            #[rustfmt::skip]
+            write_accessors(&mut any_accessors, attr_kind, attr_variant, false, write, TagImpl::Any);
+            if write {
+                #[rustfmt::skip]
+                write_accessors(&mut global_accessors, attr_kind, attr_variant, false, true, TagImpl::Tag);
+            }
         }
     }
 
@@ -368,49 +495,36 @@ fn write_tag_kind(f: &mut impl std::fmt::Write) {
     for (name, attr) in ATTRS.iter() {
         let struct_name = attr.struct_name();
         let accessor = attr.accessor_name();
-        writeln!(f, "    #[inline(always)]").ok();
-        #[rustfmt::skip]
-        writeln!(f, "    fn get_{accessor}(&self, ordinal: usize) -> Option<&{struct_name}> {{").ok();
-        #[rustfmt::skip]
-        writeln!(f, "        self.attrs.get(ordinal).map(Attr::unwrap_{accessor})").ok();
-        writeln!(f, "    }}").ok();
-        writeln!(f).ok();
-        writeln!(f, "    #[allow(unused)]").ok();
-        writeln!(f, "    #[inline(always)]").ok();
-        #[rustfmt::skip]
-        writeln!(f, "    fn set_{accessor}(&mut self, attr: {struct_name}) {{").ok();
-        writeln!(f, "        self.attrs.set(Attr::{name}(attr));").ok();
-        writeln!(f, "    }}").ok();
-        writeln!(f).ok();
-        writeln!(f, "    #[allow(unused)]").ok();
-        writeln!(f, "    #[inline(always)]").ok();
-        #[rustfmt::skip]
-        writeln!(f, "    fn set_or_remove_{accessor}(&mut self, ordinal: usize, attr: Option<{struct_name}>) {{").ok();
-        #[rustfmt::skip]
-        writeln!(f, "        self.attrs.set_or_remove(ordinal, attr.map(Attr::{name}));").ok();
-        writeln!(f, "    }}").ok();
-        writeln!(f).ok();
-    }
-    for attr_kind in ATTRS.values() {
-        for attr_variant in attr_kind.variants.iter() {
-            let write = attr_variant.global;
-            write_accessors(f, attr_kind, attr_variant, false, write, TagImpl::Any);
-        }
+        write!(
+            f,
+            "    #[inline(always)]
+    fn get_{accessor}(&self, ordinal: usize) -> Option<&{struct_name}> {{
+        self.attrs.get(ordinal).map(Attr::unwrap_{accessor})
+    }}
+
+    #[allow(unused)]
+    #[inline(always)]
+    fn set_{accessor}(&mut self, attr: {struct_name}) {{
+        self.attrs.set(Attr::{name}(attr));
+    }}
+
+    #[allow(unused)]
+    #[inline(always)]
+    fn set_or_remove_{accessor}(&mut self, ordinal: usize, attr: Option<{struct_name}>) {{
+        self.attrs.set_or_remove(ordinal, attr.map(Attr::{name}));
+    }}
+
+"
+        )
+        .ok();
     }
+    f.write_str(&any_accessors).ok();
     writeln!(f, "}}").ok();
     writeln!(f).ok();
 
     // Accessors for global attributes.
     writeln!(f, "impl<T> Tag<T> {{").ok();
-    for attr_kind in ATTRS.values() {
-        for attr_variant in attr_kind.variants.iter() {
-            if !attr_variant.global {
-                continue;
-            }
-
-            write_accessors(f, attr_kind, attr_variant, false, true, TagImpl::Tag);
-        }
-    }
+    f.write_str(&global_accessors).ok();
     writeln!(f, "}}").ok();
     writeln!(f).ok();
 
@@ -418,9 +532,7 @@ fn write_tag_kind(f: &mut impl std::fmt::Write) {
     writeln!(f, "pub mod kind {{").ok();
     for variant @ TagVariant { name, .. } in TAG.variants.iter() {
         // Struct definition.
-        for comment in variant.comments.iter() {
-            writeln!(f, "    ///{comment}").ok();
-        }
+        f.write_str(variant.docs()).ok();
         writeln!(f, "    #[derive(Clone, Debug, PartialEq)]").ok();
         writeln!(f, "    pub struct {name};").ok();
         writeln!(f).ok();
@@ -428,64 +540,65 @@ fn write_tag_kind(f: &mut impl std::fmt::Write) {
     writeln!(f, "}}").ok();
     writeln!(f).ok();
 
-    for variant @ TagVariant { name, .. } in TAG.variants.iter() {
-        // From impl.
-        writeln!(f, "impl From<Tag<kind::{name}>> for TagKind {{").ok();
-        writeln!(f, "    fn from(value: Tag<kind::{name}>) -> Self {{").ok();
-        writeln!(f, "        Self::{name}(value)").ok();
-        writeln!(f, "    }}").ok();
-        writeln!(f, "}}").ok();
+    for variant in TAG.variants.iter() {
+        write_tag_variant(f, variant);
+    }
+}
 
-        // Constructor
-        writeln!(f, "impl Tag<kind::{name}> {{").ok();
-        for comment in variant.comments.iter() {
-            writeln!(f, "    ///{comment}").ok();
+fn write_tag_variant(f: &mut impl std::fmt::Write, variant: &TagVariant) {
+    let name = variant.name;
+    // From impl and constructor.
+    writeln!(f, "impl_from_tag!({name});").ok();
+    writeln!(f, "impl Tag<kind::{name}> {{").ok();
+    f.write_str(variant.docs()).ok();
+    if variant.required.is_empty() && variant.suggested.is_empty() {
+        // A constant rather than `#[derive(Default)]`: `Tag<T>` is shared by
+        // all tag kinds, so a derived impl would also allow constructing tags
+        // that have required attributes without them.
+        writeln!(f, "    #[allow(non_upper_case_globals)]").ok();
+        writeln!(f, "    pub const {name}: Tag<kind::{name}> = Tag::new();").ok();
+    } else {
+        // The parameters are written straight into the output, the
+        // trailing comma is removed by rustfmt.
+        writeln!(f, "    #[allow(non_snake_case)]").ok();
+        write!(f, "    pub fn {name}(").ok();
+        for attr in variant.required.iter() {
+            let param = attr.variant.accessor_name();
+            let ty = attr.variant.param_type();
+            write!(f, "{param}: {ty}, ").ok();
         }
-        if variant.required.is_empty() && variant.suggested.is_empty() {
-            writeln!(f, "    #[allow(non_upper_case_globals)]").ok();
-            writeln!(f, "    pub const {name}: Tag<kind::{name}> = Tag::new();").ok();
-        } else {
-            let params = (variant.required.iter())
-                .map(|(_, attr_variant)| {
-                    let name = attr_variant.accessor_name();
-                    let ty = attr_variant.param_type();
-                    format!("{name}: {ty}")
-                })
-                .chain((variant.suggested.iter()).map(|(_, attr_variant)| {
-                    let name = attr_variant.accessor_name();
-                    let ty = attr_variant.param_type();
-                    format!("{name}: Option<{ty}>")
-                }))
-                .collect::<Vec<_>>()
-                .join(", ");
-            writeln!(f, "    #[allow(non_snake_case)]").ok();
-            writeln!(f, "    pub fn {name}({params}) -> Tag<kind::{name}> {{").ok();
-            writeln!(f, "        let mut tag = Tag::new();").ok();
-            for (_, attr_variant) in variant.required.iter().chain(variant.suggested.iter()) {
-                let name = attr_variant.accessor_name();
-                writeln!(f, "        tag.set_{name}({name});").ok();
-            }
-            writeln!(f, "        tag").ok();
-            writeln!(f, "    }}").ok();
+        for attr in variant.suggested.iter() {
+            let param = attr.variant.accessor_name();
+            let ty = attr.variant.param_type();
+            write!(f, "{param}: Option<{ty}>, ").ok();
+        }
+        writeln!(f, ") -> Tag<kind::{name}> {{").ok();
+        writeln!(f, "        let mut tag = Tag::new();").ok();
+        for attr in variant.required.iter().chain(variant.suggested.iter()) {
+            let name = attr.variant.accessor_name();
+            writeln!(f, "        tag.set_{name}({name});").ok();
         }
+        writeln!(f, "        tag").ok();
+        writeln!(f, "    }}").ok();
+    }
 
-        // Accessors for tag specific attributes.
-        for (attr_kind, attr_variant) in variant.required.iter() {
-            if attr_variant.global {
-                continue;
-            }
-            write_accessors(f, attr_kind, attr_variant, true, true, TagImpl::Tag);
+    // Accessors for tag specific attributes.
+    for attr in variant.required.iter() {
+        if attr.variant.global {
+            continue;
         }
-        for (attr_kind, attr_variant) in variant.optional.iter() {
-            if attr_variant.global {
-                continue;
-            }
-            write_accessors(f, attr_kind, attr_variant, false, true, TagImpl::Tag);
+        write_accessors(f, attr.kind, attr.variant, true, true, TagImpl::Tag);
+    }
+    for attr in variant.optional.iter() {
+        if attr.variant.global {
+            continue;
         }
-
-        writeln!(f, "}}").ok();
-        writeln!(f).ok();
+        f.write_str(attr.variant.optional_tag_accessors(attr.kind))
+            .ok();
     }
+
+    writeln!(f, "}}").ok();
+    writeln!(f).ok();
 }
 
 #[derive(PartialEq, Eq)]
@@ -512,9 +625,7 @@ fn write_accessors(
     let param_mapping = attr_variant.param_mapping();
     let ret_ty = attr_variant.return_type();
     writeln!(f).ok();
-    for comment in attr_variant.comments.iter() {
-        writeln!(f, "    ///{comment}").ok();
-    }
+    f.write_str(attr_variant.docs()).ok();
     if required {
         writeln!(f, "    pub fn {accessor}(&self) -> {ret_ty} {{").ok();
     } else {
@@ -548,7 +659,7 @@ fn write_accessors(
         TagImpl::Tag => "self.inner",
         TagImpl::Any => "self",
     };
-    write_setter_comment(f, &attr_variant.comments);
+    f.write_str(attr_variant.setter_comment()).ok();
     #[rustfmt::skip]
     if required {
         writeln!(f, "    pub fn set_{accessor}(&mut self, {accessor}: {param_ty}) {{").ok();
@@ -567,28 +678,31 @@ fn write_accessors(
     writeln!(f, "    }}").ok();
     writeln!(f).ok();
 
-    write_setter_comment(f, &attr_variant.comments);
+    f.write_str(attr_variant.setter_comment()).ok();
     #[rustfmt::skip]
     if required {
         writeln!(f, "    pub fn with_{accessor}(mut self, {accessor}: {param_ty}) -> Self {{").ok();
     } else {
         writeln!(f, "    pub fn with_{accessor}(mut self, {accessor}: Option<{param_ty}>) -> Self {{").ok();
     };
-    writeln!(f, "        self.set_{accessor}({accessor});").ok();
-    writeln!(f, "        self").ok();
-    writeln!(f, "    }}").ok();
+    write!(
+        f,
+        "        self.set_{accessor}({accessor});
+        self
+    }}
+"
+    )
+    .ok();
 }
 
-fn write_setter_comment(f: &mut impl std::fmt::Write, comments: &[&str]) {
-    if let Some(comment) = comments.first() {
-        let line = comment.trim_start();
-        let first = line.chars().next().unwrap();
-        let remainder = &line[first.len_utf8()..];
-        writeln!(f, "    /// Set {}{remainder}", first.to_lowercase()).ok();
-    }
-    for comment in comments.iter().skip(1) {
-        writeln!(f, "    ///{comment}").ok();
+/// Renders comment lines as a doc comment. It is left unindented, that is
+/// taken care of by rustfmt.
+fn doc_comment(comments: &[&str]) -> &'static str {
+    let mut buf = String::new();
+    for comment in comments {
+        writeln!(buf, "///{comment}").ok();
     }
+    buf.leak()
 }
 
 fn write_any_attr(f: &mut impl std::fmt::Write) {
@@ -605,86 +719,93 @@ fn write_any_attr(f: &mut impl std::fmt::Write) {
     for (name, attr) in ATTRS.iter() {
         let struct_name = attr.struct_name();
         let accessor = attr.accessor_name();
-        writeln!(f).ok();
-        writeln!(f, "        #[inline(always)]").ok();
-        writeln!(
+        write!(
             f,
-            "        fn unwrap_{accessor}(&self) -> &{struct_name} {{"
+            "
+    #[inline(always)]
+    fn unwrap_{accessor}(&self) -> &{struct_name} {{
+        match self {{
+            Self::{name}(attr) => attr,
+            _ => unreachable!(),
+        }}
+    }}
+"
         )
         .ok();
-        writeln!(f, "            match self {{").ok();
-        #[rustfmt::skip]
-        writeln!(f, "                Self::{name}(attr) => attr,").ok();
-        writeln!(f, "                _ => unreachable!(),").ok();
-        writeln!(f, "            }}").ok();
-        writeln!(f, "        }}").ok();
     }
-    writeln!(f, "}}").ok();
-
-    writeln!(f, "impl Ordinal for Attr {{").ok();
-    writeln!(f, "    fn ordinal(&self) -> usize {{").ok();
-    writeln!(f, "        match self {{").ok();
+    write!(
+        f,
+        "\
+}}
+impl Ordinal for Attr {{
+    fn ordinal(&self) -> usize {{
+        match self {{
+"
+    )
+    .ok();
     for attr in ATTRS.keys() {
         writeln!(f, "            Self::{attr}(a) => a.ordinal(),").ok();
     }
-    writeln!(f, "        }}").ok();
-    writeln!(f, "    }}").ok();
-    writeln!(f, "}}").ok();
-    writeln!(f).ok();
+    write!(f, "{ORDINAL_IMPL_END}").ok();
 }
 
 fn write_attr(f: &mut impl std::fmt::Write, attr: &Attr, ordinal_offset: usize) {
     let struct_name = attr.struct_name();
     writeln!(f, "#[derive(Clone, Debug, PartialEq)]").ok();
     writeln!(f, "pub(crate) enum {struct_name} {{").ok();
-    for variant @ AttrVariant { name, ty, .. } in attr.variants.iter() {
-        for comment in variant.comments.iter() {
-            writeln!(f, "    ///{comment}").ok();
-        }
+    for variant @ AttrVariant { name, ty, .. } in attr.variants.values() {
+        f.write_str(variant.docs()).ok();
         writeln!(f, "    {name}({ty}),").ok();
     }
     writeln!(f, "}}").ok();
     writeln!(f).ok();
 
     writeln!(f, "impl {struct_name} {{").ok();
-    for (i, variant) in attr.variants.iter().enumerate() {
+    for (i, variant) in attr.variants.values().enumerate() {
         let o = ordinal_offset + i;
         let ordinal = variant.ordinal_name();
         #[rustfmt::skip]
         writeln!(f, "    pub(crate) const {ordinal}: usize = {o};").ok();
     }
-    for variant @ AttrVariant { name, .. } in attr.variants.iter() {
+    for variant @ AttrVariant { name, .. } in attr.variants.values() {
         let accessor = variant.accessor_name();
         let ret_ty = variant.return_type();
         let ret_mapping = variant.return_mapping();
-        writeln!(f).ok();
-        writeln!(f, "        #[inline(always)]").ok();
-        writeln!(f, "        fn unwrap_{accessor}(&self) -> {ret_ty} {{").ok();
-        writeln!(f, "            match self {{").ok();
-        #[rustfmt::skip]
-        writeln!(f, "                Self::{name}(val) => {ret_mapping},").ok();
+        write!(
+            f,
+            "
+    #[inline(always)]
+    fn unwrap_{accessor}(&self) -> {ret_ty} {{
+        match self {{
+            Self::{name}(val) => {ret_mapping},
+"
+        )
+        .ok();
         if attr.variants.len() > 1 {
-            writeln!(f, "                _ => unreachable!(),").ok();
+            writeln!(f, "            _ => unreachable!(),").ok();
         }
-        writeln!(f, "            }}").ok();
         writeln!(f, "        }}").ok();
+        writeln!(f, "    }}").ok();
     }
     writeln!(f, "}}").ok();
     writeln!(f).ok();
 
-    writeln!(f, "impl Ordinal for {struct_name} {{").ok();
-    writeln!(f, "    fn ordinal(&self) -> usize {{").ok();
-    writeln!(f, "        match self {{").ok();
-    for variant in attr.variants.iter() {
+    write!(
+        f,
+        "\
+impl Ordinal for {struct_name} {{
+    fn ordinal(&self) -> usize {{
+        match self {{
+"
+    )
+    .ok();
+    for variant in attr.variants.values() {
         let name = variant.name;
         let ordinal = variant.ordinal_name();
         #[rustfmt::skip]
         writeln!(f, "            Self::{name}(_) => Self::{ordinal},").ok();
     }
-    writeln!(f, "        }}").ok();
-    writeln!(f, "    }}").ok();
-    writeln!(f, "}}").ok();
-    writeln!(f).ok();
+    write!(f, "{ORDINAL_IMPL_END}").ok();
 }
 
 trait ExpectKey<'a> {
@@ -754,9 +875,15 @@ impl<'a> ExpectValue<'a> for MapArrayInlineEntry<'a> {
 
 fn comment_lines<'a>(repr: &MapTableEntryRepr) -> Vec<&'a str> {
     let comments = repr.kind.comments().unwrap();
-    (TOML.ast.direct_comments(comments))
+    let lines = (TOML.ast.direct_comments(comments))
         .filter_map(|(pos, str)| (pos == AssocPos::Above).then_some(&str[1..]))
-        .collect()
+        .collect::<Vec<_>>();
+    // Everything generated from an entry is public and krilla denies missing
+    // docs, so report this here instead of when compiling krilla.
+    if lines.is_empty() {
+        report_error("missing doc comment", repr.repr_span());
+    }
+    lines
 }
 
 fn report_error(msg: &str, span: Span) -> ! {
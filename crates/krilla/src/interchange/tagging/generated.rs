@@ -2,7 +2,8 @@
 //
 // To update it:
 // 1. Edit the `generate.toml` file inside of this directory
-// 2. Run `cargo run --bin=codegen` from the repository root
+// 2. Run `cargo run --bin=codegen` from anywhere inside the repository
+//    (this requires `rustfmt` to be installed)
 
 /// A tag for group nodes.
 #[derive(Clone, Debug, PartialEq)]
@@ -136,6 +137,7 @@ pub enum TagKind {
 
 impl TagKind {
     /// A type erased tag, which allows reading all attributes.
+    #[inline]
     pub fn as_any(&self) -> &AnyTag {
         match self {
             Self::Part(tag) => tag.as_any(),
@@ -182,6 +184,7 @@ impl TagKind {
 
     /// A type erased tag, which allows reading all attributes and additionally
     /// writing all global attributes.
+    #[inline]
     pub fn as_any_mut(&mut self) -> &mut AnyTag {
         match self {
             Self::Part(tag) => tag.as_any_mut(),
@@ -598,11 +601,15 @@ impl TagKind {
 
     /// Set the color of the text decoration, overriding the fill color.
     pub fn set_text_decoration_color(&mut self, text_decoration_color: Option<NaiveRgbColor>) {
-        self.as_any_mut().set_text_decoration_color(text_decoration_color);
+        self.as_any_mut()
+            .set_text_decoration_color(text_decoration_color);
     }
 
     /// Set the color of the text decoration, overriding the fill color.
-    pub fn with_text_decoration_color(mut self, text_decoration_color: Option<NaiveRgbColor>) -> Self {
+    pub fn with_text_decoration_color(
+        mut self,
+        text_decoration_color: Option<NaiveRgbColor>,
+    ) -> Self {
         self.set_text_decoration_color(text_decoration_color);
         self
     }
@@ -614,11 +621,15 @@ impl TagKind {
 
     /// Set the width of the text decoration line.
     pub fn set_text_decoration_thickness(&mut self, text_decoration_thickness: Option<f32>) {
-        self.as_any_mut().set_text_decoration_thickness(text_decoration_thickness);
+        self.as_any_mut()
+            .set_text_decoration_thickness(text_decoration_thickness);
     }
 
     /// Set the width of the text decoration line.
-    pub fn with_text_decoration_thickness(mut self, text_decoration_thickness: Option<f32>) -> Self {
+    pub fn with_text_decoration_thickness(
+        mut self,
+        text_decoration_thickness: Option<f32>,
+    ) -> Self {
         self.set_text_decoration_thickness(text_decoration_thickness);
         self
     }
@@ -630,11 +641,15 @@ impl TagKind {
 
     /// Set the kind of text decoration.
     pub fn set_text_decoration_type(&mut self, text_decoration_type: Option<TextDecorationType>) {
-        self.as_any_mut().set_text_decoration_type(text_decoration_type);
+        self.as_any_mut()
+            .set_text_decoration_type(text_decoration_type);
     }
 
     /// Set the kind of text decoration.
-    pub fn with_text_decoration_type(mut self, text_decoration_type: Option<TextDecorationType>) -> Self {
+    pub fn with_text_decoration_type(
+        mut self,
+        text_decoration_type: Option<TextDecorationType>,
+    ) -> Self {
         self.set_text_decoration_type(text_decoration_type);
         self
     }
@@ -645,12 +660,19 @@ impl TagKind {
     }
 
     /// Set how the glyphs are rotated in a vertical writing mode.
-    pub fn set_glyph_orientation_vertical(&mut self, glyph_orientation_vertical: Option<GlyphOrientationVertical>) {
-        self.as_any_mut().set_glyph_orientation_vertical(glyph_orientation_vertical);
+    pub fn set_glyph_orientation_vertical(
+        &mut self,
+        glyph_orientation_vertical: Option<GlyphOrientationVertical>,
+    ) {
+        self.as_any_mut()
+            .set_glyph_orientation_vertical(glyph_orientation_vertical);
     }
 
     /// Set how the glyphs are rotated in a vertical writing mode.
-    pub fn with_glyph_orientation_vertical(mut self, glyph_orientation_vertical: Option<GlyphOrientationVertical>) -> Self {
+    pub fn with_glyph_orientation_vertical(
+        mut self,
+        glyph_orientation_vertical: Option<GlyphOrientationVertical>,
+    ) -> Self {
         self.set_glyph_orientation_vertical(glyph_orientation_vertical);
         self
     }
@@ -741,7 +763,6 @@ impl AnyTag {
         self.attrs.set_or_remove(ordinal, attr.map(Attr::Layout));
     }
 
-
     /// The tag id.
     pub fn id(&self) -> Option<&TagId> {
         self.get_struct(StructAttr::ID).map(StructAttr::unwrap_id)
@@ -760,7 +781,8 @@ impl AnyTag {
 
     /// The language of this tag.
     pub fn lang(&self) -> Option<&str> {
-        self.get_struct(StructAttr::LANG).map(StructAttr::unwrap_lang)
+        self.get_struct(StructAttr::LANG)
+            .map(StructAttr::unwrap_lang)
     }
 
     /// Set the language of this tag.
@@ -777,7 +799,8 @@ impl AnyTag {
     /// The optional alternate text that describes the text (for example, if the text
     /// consists of a star symbol, the alt text should describe that in natural language).
     pub fn alt_text(&self) -> Option<&str> {
-        self.get_struct(StructAttr::ALT_TEXT).map(StructAttr::unwrap_alt_text)
+        self.get_struct(StructAttr::ALT_TEXT)
+            .map(StructAttr::unwrap_alt_text)
     }
 
     /// Set the optional alternate text that describes the text (for example, if the text
@@ -796,7 +819,8 @@ impl AnyTag {
     /// The expanded form of an abbreviation.
     /// Only applicable if the content of the tag is an abbreviation.
     pub fn expanded(&self) -> Option<&str> {
-        self.get_struct(StructAttr::EXPANDED).map(StructAttr::unwrap_expanded)
+        self.get_struct(StructAttr::EXPANDED)
+            .map(StructAttr::unwrap_expanded)
     }
 
     /// Set the expanded form of an abbreviation.
@@ -816,14 +840,18 @@ impl AnyTag {
     /// some curves that artistically represent some word. This should be the exact
     /// replacement text of the word.
     pub fn actual_text(&self) -> Option<&str> {
-        self.get_struct(StructAttr::ACTUAL_TEXT).map(StructAttr::unwrap_actual_text)
+        self.get_struct(StructAttr::ACTUAL_TEXT)
+            .map(StructAttr::unwrap_actual_text)
     }
 
     /// Set the actual text represented by the content of this tag, i.e. if it contained
     /// some curves that artistically represent some word. This should be the exact
     /// replacement text of the word.
     pub fn set_actual_text(&mut self, actual_text: Option<String>) {
-        self.set_or_remove_struct(StructAttr::ACTUAL_TEXT, actual_text.map(StructAttr::ActualText));
+        self.set_or_remove_struct(
+            StructAttr::ACTUAL_TEXT,
+            actual_text.map(StructAttr::ActualText),
+        );
     }
 
     /// Set the actual text represented by the content of this tag, i.e. if it contained
@@ -836,27 +864,32 @@ impl AnyTag {
 
     /// The title, characterizing a specific tag such as `"Chapter 1"`.
     pub fn title(&self) -> Option<&str> {
-        self.get_struct(StructAttr::TITLE).map(StructAttr::unwrap_title)
+        self.get_struct(StructAttr::TITLE)
+            .map(StructAttr::unwrap_title)
     }
 
     /// The heading level
     pub fn level(&self) -> Option<NonZeroU16> {
-        self.get_struct(StructAttr::HEADING_LEVEL).map(StructAttr::unwrap_level)
+        self.get_struct(StructAttr::HEADING_LEVEL)
+            .map(StructAttr::unwrap_level)
     }
 
     /// The list numbering.
     pub fn numbering(&self) -> Option<ListNumbering> {
-        self.get_list(ListAttr::NUMBERING).map(ListAttr::unwrap_numbering)
+        self.get_list(ListAttr::NUMBERING)
+            .map(ListAttr::unwrap_numbering)
     }
 
     /// The table summary.
     pub fn summary(&self) -> Option<&str> {
-        self.get_table(TableAttr::SUMMARY).map(TableAttr::unwrap_summary)
+        self.get_table(TableAttr::SUMMARY)
+            .map(TableAttr::unwrap_summary)
     }
 
     /// The table header scope.
     pub fn scope(&self) -> Option<TableHeaderScope> {
-        self.get_table(TableAttr::HEADER_SCOPE).map(TableAttr::unwrap_scope)
+        self.get_table(TableAttr::HEADER_SCOPE)
+            .map(TableAttr::unwrap_scope)
     }
 
     /// The list of headers associated with a table cell.
@@ -867,22 +900,26 @@ impl AnyTag {
     ///
     /// This allows specifying header hierarchies inside tables.
     pub fn headers(&self) -> Option<&[TagId]> {
-        self.get_table(TableAttr::CELL_HEADERS).map(TableAttr::unwrap_headers)
+        self.get_table(TableAttr::CELL_HEADERS)
+            .map(TableAttr::unwrap_headers)
     }
 
     /// The row span of this table cell.
     pub fn row_span(&self) -> Option<NonZeroU32> {
-        self.get_table(TableAttr::ROW_SPAN).map(TableAttr::unwrap_row_span)
+        self.get_table(TableAttr::ROW_SPAN)
+            .map(TableAttr::unwrap_row_span)
     }
 
     /// The column span of this table cell.
     pub fn col_span(&self) -> Option<NonZeroU32> {
-        self.get_table(TableAttr::COL_SPAN).map(TableAttr::unwrap_col_span)
+        self.get_table(TableAttr::COL_SPAN)
+            .map(TableAttr::unwrap_col_span)
     }
 
     /// The placement.
     pub fn placement(&self) -> Option<Placement> {
-        self.get_layout(LayoutAttr::PLACEMENT).map(LayoutAttr::unwrap_placement)
+        self.get_layout(LayoutAttr::PLACEMENT)
+            .map(LayoutAttr::unwrap_placement)
     }
 
     /// Set the placement.
@@ -898,12 +935,16 @@ impl AnyTag {
 
     /// The writing mode.
     pub fn writing_mode(&self) -> Option<WritingMode> {
-        self.get_layout(LayoutAttr::WRITING_MODE).map(LayoutAttr::unwrap_writing_mode)
+        self.get_layout(LayoutAttr::WRITING_MODE)
+            .map(LayoutAttr::unwrap_writing_mode)
     }
 
     /// Set the writing mode.
     pub fn set_writing_mode(&mut self, writing_mode: Option<WritingMode>) {
-        self.set_or_remove_layout(LayoutAttr::WRITING_MODE, writing_mode.map(LayoutAttr::WritingMode));
+        self.set_or_remove_layout(
+            LayoutAttr::WRITING_MODE,
+            writing_mode.map(LayoutAttr::WritingMode),
+        );
     }
 
     /// Set the writing mode.
@@ -915,27 +956,34 @@ impl AnyTag {
     /// The bounding box of a tag that encloses its visible content.
     /// If the content spans multiple pages, this should be omitted.
     pub fn bbox(&self) -> Option<BBox> {
-        self.get_layout(LayoutAttr::B_BOX).map(LayoutAttr::unwrap_bbox)
+        self.get_layout(LayoutAttr::B_BOX)
+            .map(LayoutAttr::unwrap_bbox)
     }
 
     /// The width.
     pub fn width(&self) -> Option<f32> {
-        self.get_layout(LayoutAttr::WIDTH).map(LayoutAttr::unwrap_width)
+        self.get_layout(LayoutAttr::WIDTH)
+            .map(LayoutAttr::unwrap_width)
     }
 
     /// The height.
     pub fn height(&self) -> Option<f32> {
-        self.get_layout(LayoutAttr::HEIGHT).map(LayoutAttr::unwrap_height)
+        self.get_layout(LayoutAttr::HEIGHT)
+            .map(LayoutAttr::unwrap_height)
     }
 
     /// The background color.
     pub fn background_color(&self) -> Option<NaiveRgbColor> {
-        self.get_layout(LayoutAttr::BACKGROUND_COLOR).map(LayoutAttr::unwrap_background_color)
+        self.get_layout(LayoutAttr::BACKGROUND_COLOR)
+            .map(LayoutAttr::unwrap_background_color)
     }
 
     /// Set the background color.
     pub fn set_background_color(&mut self, background_color: Option<NaiveRgbColor>) {
-        self.set_or_remove_layout(LayoutAttr::BACKGROUND_COLOR, background_color.map(LayoutAttr::BackgroundColor));
+        self.set_or_remove_layout(
+            LayoutAttr::BACKGROUND_COLOR,
+            background_color.map(LayoutAttr::BackgroundColor),
+        );
     }
 
     /// Set the background color.
@@ -946,12 +994,16 @@ impl AnyTag {
 
     /// The border color.
     pub fn border_color(&self) -> Option<Sides<NaiveRgbColor>> {
-        self.get_layout(LayoutAttr::BORDER_COLOR).map(LayoutAttr::unwrap_border_color)
+        self.get_layout(LayoutAttr::BORDER_COLOR)
+            .map(LayoutAttr::unwrap_border_color)
     }
 
     /// Set the border color.
     pub fn set_border_color(&mut self, border_color: Option<Sides<NaiveRgbColor>>) {
-        self.set_or_remove_layout(LayoutAttr::BORDER_COLOR, border_color.map(LayoutAttr::BorderColor));
+        self.set_or_remove_layout(
+            LayoutAttr::BORDER_COLOR,
+            border_color.map(LayoutAttr::BorderColor),
+        );
     }
 
     /// Set the border color.
@@ -962,12 +1014,16 @@ impl AnyTag {
 
     /// The way the border is drawn.
     pub fn border_style(&self) -> Option<Sides<BorderStyle>> {
-        self.get_layout(LayoutAttr::BORDER_STYLE).map(LayoutAttr::unwrap_border_style)
+        self.get_layout(LayoutAttr::BORDER_STYLE)
+            .map(LayoutAttr::unwrap_border_style)
     }
 
     /// Set the way the border is drawn.
     pub fn set_border_style(&mut self, border_style: Option<Sides<BorderStyle>>) {
-        self.set_or_remove_layout(LayoutAttr::BORDER_STYLE, border_style.map(LayoutAttr::BorderStyle));
+        self.set_or_remove_layout(
+            LayoutAttr::BORDER_STYLE,
+            border_style.map(LayoutAttr::BorderStyle),
+        );
     }
 
     /// Set the way the border is drawn.
@@ -978,12 +1034,16 @@ impl AnyTag {
 
     /// The border width.
     pub fn border_thickness(&self) -> Option<Sides<f32>> {
-        self.get_layout(LayoutAttr::BORDER_THICKNESS).map(LayoutAttr::unwrap_border_thickness)
+        self.get_layout(LayoutAttr::BORDER_THICKNESS)
+            .map(LayoutAttr::unwrap_border_thickness)
     }
 
     /// Set the border width.
     pub fn set_border_thickness(&mut self, border_thickness: Option<Sides<f32>>) {
-        self.set_or_remove_layout(LayoutAttr::BORDER_THICKNESS, border_thickness.map(LayoutAttr::BorderThickness));
+        self.set_or_remove_layout(
+            LayoutAttr::BORDER_THICKNESS,
+            border_thickness.map(LayoutAttr::BorderThickness),
+        );
     }
 
     /// Set the border width.
@@ -994,7 +1054,8 @@ impl AnyTag {
 
     /// The padding inside of an element.
     pub fn padding(&self) -> Option<Sides<f32>> {
-        self.get_layout(LayoutAttr::PADDING).map(LayoutAttr::unwrap_padding)
+        self.get_layout(LayoutAttr::PADDING)
+            .map(LayoutAttr::unwrap_padding)
     }
 
     /// Set the padding inside of an element.
@@ -1010,7 +1071,8 @@ impl AnyTag {
 
     /// The color of text, borders, and text decorations.
     pub fn color(&self) -> Option<NaiveRgbColor> {
-        self.get_layout(LayoutAttr::COLOR).map(LayoutAttr::unwrap_color)
+        self.get_layout(LayoutAttr::COLOR)
+            .map(LayoutAttr::unwrap_color)
     }
 
     /// Set the color of text, borders, and text decorations.
@@ -1026,63 +1088,77 @@ impl AnyTag {
 
     /// The spacing before the block-level element.
     pub fn space_before(&self) -> Option<f32> {
-        self.get_layout(LayoutAttr::SPACE_BEFORE).map(LayoutAttr::unwrap_space_before)
+        self.get_layout(LayoutAttr::SPACE_BEFORE)
+            .map(LayoutAttr::unwrap_space_before)
     }
 
     /// The spacing after the block-level element.
     pub fn space_after(&self) -> Option<f32> {
-        self.get_layout(LayoutAttr::SPACE_AFTER).map(LayoutAttr::unwrap_space_after)
+        self.get_layout(LayoutAttr::SPACE_AFTER)
+            .map(LayoutAttr::unwrap_space_after)
     }
 
     /// The spacing between the start inline edge of the element and the parent.
     pub fn start_indent(&self) -> Option<f32> {
-        self.get_layout(LayoutAttr::START_INDENT).map(LayoutAttr::unwrap_start_indent)
+        self.get_layout(LayoutAttr::START_INDENT)
+            .map(LayoutAttr::unwrap_start_indent)
     }
 
     /// The spacing between the end inline edge of the element and the parent.
     pub fn end_indent(&self) -> Option<f32> {
-        self.get_layout(LayoutAttr::END_INDENT).map(LayoutAttr::unwrap_end_indent)
+        self.get_layout(LayoutAttr::END_INDENT)
+            .map(LayoutAttr::unwrap_end_indent)
     }
 
     /// The amount the first line of text in a block-level element is indented. Only
     /// applicable to paragraph-like elements with non-block-level elements.
     pub fn text_indent(&self) -> Option<f32> {
-        self.get_layout(LayoutAttr::TEXT_INDENT).map(LayoutAttr::unwrap_text_indent)
+        self.get_layout(LayoutAttr::TEXT_INDENT)
+            .map(LayoutAttr::unwrap_text_indent)
     }
 
     /// The text alignment.
     pub fn text_align(&self) -> Option<TextAlign> {
-        self.get_layout(LayoutAttr::TEXT_ALIGN).map(LayoutAttr::unwrap_text_align)
+        self.get_layout(LayoutAttr::TEXT_ALIGN)
+            .map(LayoutAttr::unwrap_text_align)
     }
 
     /// The alignment of block-level elements inside of this block-level element.
     pub fn block_align(&self) -> Option<BlockAlign> {
-        self.get_layout(LayoutAttr::BLOCK_ALIGN).map(LayoutAttr::unwrap_block_align)
+        self.get_layout(LayoutAttr::BLOCK_ALIGN)
+            .map(LayoutAttr::unwrap_block_align)
     }
 
     /// The alignment of inline-level elements inside of this block-level element.
     pub fn inline_align(&self) -> Option<InlineAlign> {
-        self.get_layout(LayoutAttr::INLINE_ALIGN).map(LayoutAttr::unwrap_inline_align)
+        self.get_layout(LayoutAttr::INLINE_ALIGN)
+            .map(LayoutAttr::unwrap_inline_align)
     }
 
     /// The border style of table cells, overriding `BorderStyle`.
     pub fn table_border_style(&self) -> Option<Sides<BorderStyle>> {
-        self.get_layout(LayoutAttr::TABLE_BORDER_STYLE).map(LayoutAttr::unwrap_table_border_style)
+        self.get_layout(LayoutAttr::TABLE_BORDER_STYLE)
+            .map(LayoutAttr::unwrap_table_border_style)
     }
 
     /// The padding inside of table cells, overriding `Padding`.
     pub fn table_padding(&self) -> Option<Sides<f32>> {
-        self.get_layout(LayoutAttr::TABLE_PADDING).map(LayoutAttr::unwrap_table_padding)
+        self.get_layout(LayoutAttr::TABLE_PADDING)
+            .map(LayoutAttr::unwrap_table_padding)
     }
 
     /// The distance by which the baseline shall be shifted from the default position.
     pub fn baseline_shift(&self) -> Option<f32> {
-        self.get_layout(LayoutAttr::BASELINE_SHIFT).map(LayoutAttr::unwrap_baseline_shift)
+        self.get_layout(LayoutAttr::BASELINE_SHIFT)
+            .map(LayoutAttr::unwrap_baseline_shift)
     }
 
     /// Set the distance by which the baseline shall be shifted from the default position.
     pub fn set_baseline_shift(&mut self, baseline_shift: Option<f32>) {
-        self.set_or_remove_layout(LayoutAttr::BASELINE_SHIFT, baseline_shift.map(LayoutAttr::BaselineShift));
+        self.set_or_remove_layout(
+            LayoutAttr::BASELINE_SHIFT,
+            baseline_shift.map(LayoutAttr::BaselineShift),
+        );
     }
 
     /// Set the distance by which the baseline shall be shifted from the default position.
@@ -1093,12 +1169,16 @@ impl AnyTag {
 
     /// The height of each line in an element on the block axis.
     pub fn line_height(&self) -> Option<LineHeight> {
-        self.get_layout(LayoutAttr::LINE_HEIGHT).map(LayoutAttr::unwrap_line_height)
+        self.get_layout(LayoutAttr::LINE_HEIGHT)
+            .map(LayoutAttr::unwrap_line_height)
     }
 
     /// Set the height of each line in an element on the block axis.
     pub fn set_line_height(&mut self, line_height: Option<LineHeight>) {
-        self.set_or_remove_layout(LayoutAttr::LINE_HEIGHT, line_height.map(LayoutAttr::LineHeight));
+        self.set_or_remove_layout(
+            LayoutAttr::LINE_HEIGHT,
+            line_height.map(LayoutAttr::LineHeight),
+        );
     }
 
     /// Set the height of each line in an element on the block axis.
@@ -1109,94 +1189,130 @@ impl AnyTag {
 
     /// The color of the text decoration, overriding the fill color.
     pub fn text_decoration_color(&self) -> Option<NaiveRgbColor> {
-        self.get_layout(LayoutAttr::TEXT_DECORATION_COLOR).map(LayoutAttr::unwrap_text_decoration_color)
+        self.get_layout(LayoutAttr::TEXT_DECORATION_COLOR)
+            .map(LayoutAttr::unwrap_text_decoration_color)
     }
 
     /// Set the color of the text decoration, overriding the fill color.
     pub fn set_text_decoration_color(&mut self, text_decoration_color: Option<NaiveRgbColor>) {
-        self.set_or_remove_layout(LayoutAttr::TEXT_DECORATION_COLOR, text_decoration_color.map(LayoutAttr::TextDecorationColor));
+        self.set_or_remove_layout(
+            LayoutAttr::TEXT_DECORATION_COLOR,
+            text_decoration_color.map(LayoutAttr::TextDecorationColor),
+        );
     }
 
     /// Set the color of the text decoration, overriding the fill color.
-    pub fn with_text_decoration_color(mut self, text_decoration_color: Option<NaiveRgbColor>) -> Self {
+    pub fn with_text_decoration_color(
+        mut self,
+        text_decoration_color: Option<NaiveRgbColor>,
+    ) -> Self {
         self.set_text_decoration_color(text_decoration_color);
         self
     }
 
     /// The width of the text decoration line.
     pub fn text_decoration_thickness(&self) -> Option<f32> {
-        self.get_layout(LayoutAttr::TEXT_DECORATION_THICKNESS).map(LayoutAttr::unwrap_text_decoration_thickness)
+        self.get_layout(LayoutAttr::TEXT_DECORATION_THICKNESS)
+            .map(LayoutAttr::unwrap_text_decoration_thickness)
     }
 
     /// Set the width of the text decoration line.
     pub fn set_text_decoration_thickness(&mut self, text_decoration_thickness: Option<f32>) {
-        self.set_or_remove_layout(LayoutAttr::TEXT_DECORATION_THICKNESS, text_decoration_thickness.map(LayoutAttr::TextDecorationThickness));
+        self.set_or_remove_layout(
+            LayoutAttr::TEXT_DECORATION_THICKNESS,
+            text_decoration_thickness.map(LayoutAttr::TextDecorationThickness),
+        );
     }
 
     /// Set the width of the text decoration line.
-    pub fn with_text_decoration_thickness(mut self, text_decoration_thickness: Option<f32>) -> Self {
+    pub fn with_text_decoration_thickness(
+        mut self,
+        text_decoration_thickness: Option<f32>,
+    ) -> Self {
         self.set_text_decoration_thickness(text_decoration_thickness);
         self
     }
 
     /// The kind of text decoration.
     pub fn text_decoration_type(&self) -> Option<TextDecorationType> {
-        self.get_layout(LayoutAttr::TEXT_DECORATION_TYPE).map(LayoutAttr::unwrap_text_decoration_type)
+        self.get_layout(LayoutAttr::TEXT_DECORATION_TYPE)
+            .map(LayoutAttr::unwrap_text_decoration_type)
     }
 
     /// Set the kind of text decoration.
     pub fn set_text_decoration_type(&mut self, text_decoration_type: Option<TextDecorationType>) {
-        self.set_or_remove_layout(LayoutAttr::TEXT_DECORATION_TYPE, text_decoration_type.map(LayoutAttr::TextDecorationType));
+        self.set_or_remove_layout(
+            LayoutAttr::TEXT_DECORATION_TYPE,
+            text_decoration_type.map(LayoutAttr::TextDecorationType),
+        );
     }
 
     /// Set the kind of text decoration.
-    pub fn with_text_decoration_type(mut self, text_decoration_type: Option<TextDecorationType>) -> Self {
+    pub fn with_text_decoration_type(
+        mut self,
+        text_decoration_type: Option<TextDecorationType>,
+    ) -> Self {
         self.set_text_decoration_type(text_decoration_type);
         self
     }
 
     /// How the glyphs are rotated in a vertical writing mode.
     pub fn glyph_orientation_vertical(&self) -> Option<GlyphOrientationVertical> {
-        self.get_layout(LayoutAttr::GLYPH_ORIENTATION_VERTICAL).map(LayoutAttr::unwrap_glyph_orientation_vertical)
+        self.get_layout(LayoutAttr::GLYPH_ORIENTATION_VERTICAL)
+            .map(LayoutAttr::unwrap_glyph_orientation_vertical)
     }
 
     /// Set how the glyphs are rotated in a vertical writing mode.
-    pub fn set_glyph_orientation_vertical(&mut self, glyph_orientation_vertical: Option<GlyphOrientationVertical>) {
-        self.set_or_remove_layout(LayoutAttr::GLYPH_ORIENTATION_VERTICAL, glyph_orientation_vertical.map(LayoutAttr::GlyphOrientationVertical));
+    pub fn set_glyph_orientation_vertical(
+        &mut self,
+        glyph_orientation_vertical: Option<GlyphOrientationVertical>,
+    ) {
+        self.set_or_remove_layout(
+            LayoutAttr::GLYPH_ORIENTATION_VERTICAL,
+            glyph_orientation_vertical.map(LayoutAttr::GlyphOrientationVertical),
+        );
     }
 
     /// Set how the glyphs are rotated in a vertical writing mode.
-    pub fn with_glyph_orientation_vertical(mut self, glyph_orientation_vertical: Option<GlyphOrientationVertical>) -> Self {
+    pub fn with_glyph_orientation_vertical(
+        mut self,
+        glyph_orientation_vertical: Option<GlyphOrientationVertical>,
+    ) -> Self {
         self.set_glyph_orientation_vertical(glyph_orientation_vertical);
         self
     }
 
     /// The number of columns in the grouping element.
     pub fn column_count(&self) -> Option<NonZeroU32> {
-        self.get_layout(LayoutAttr::COLUMN_COUNT).map(LayoutAttr::unwrap_column_count)
+        self.get_layout(LayoutAttr::COLUMN_COUNT)
+            .map(LayoutAttr::unwrap_column_count)
     }
 
     /// The width of the gaps between columns in the grouping element.
     pub fn column_gap(&self) -> Option<&ColumnDimensions> {
-        self.get_layout(LayoutAttr::COLUMN_GAP).map(LayoutAttr::unwrap_column_gap)
+        self.get_layout(LayoutAttr::COLUMN_GAP)
+            .map(LayoutAttr::unwrap_column_gap)
     }
 
     /// The width of the columns in the grouping element.
     pub fn column_widths(&self) -> Option<&ColumnDimensions> {
-        self.get_layout(LayoutAttr::COLUMN_WIDTHS).map(LayoutAttr::unwrap_column_widths)
+        self.get_layout(LayoutAttr::COLUMN_WIDTHS)
+            .map(LayoutAttr::unwrap_column_widths)
     }
 }
 
 impl<T> Tag<T> {
-
     /// The tag id.
     pub fn id(&self) -> Option<&TagId> {
-        self.inner.get_struct(StructAttr::ID).map(StructAttr::unwrap_id)
+        self.inner
+            .get_struct(StructAttr::ID)
+            .map(StructAttr::unwrap_id)
     }
 
     /// Set the tag id.
     pub fn set_id(&mut self, id: Option<TagId>) {
-        self.inner.set_or_remove_struct(StructAttr::ID, id.map(StructAttr::Id));
+        self.inner
+            .set_or_remove_struct(StructAttr::ID, id.map(StructAttr::Id));
     }
 
     /// Set the tag id.
@@ -1207,12 +1323,15 @@ impl<T> Tag<T> {
 
     /// The language of this tag.
     pub fn lang(&self) -> Option<&str> {
-        self.inner.get_struct(StructAttr::LANG).map(StructAttr::unwrap_lang)
+        self.inner
+            .get_struct(StructAttr::LANG)
+            .map(StructAttr::unwrap_lang)
     }
 
     /// Set the language of this tag.
     pub fn set_lang(&mut self, lang: Option<String>) {
-        self.inner.set_or_remove_struct(StructAttr::LANG, lang.map(StructAttr::Lang));
+        self.inner
+            .set_or_remove_struct(StructAttr::LANG, lang.map(StructAttr::Lang));
     }
 
     /// Set the language of this tag.
@@ -1224,13 +1343,16 @@ impl<T> Tag<T> {
     /// The optional alternate text that describes the text (for example, if the text
     /// consists of a star symbol, the alt text should describe that in natural language).
     pub fn alt_text(&self) -> Option<&str> {
-        self.inner.get_struct(StructAttr::ALT_TEXT).map(StructAttr::unwrap_alt_text)
+        self.inner
+            .get_struct(StructAttr::ALT_TEXT)
+            .map(StructAttr::unwrap_alt_text)
     }
 
     /// Set the optional alternate text that describes the text (for example, if the text
     /// consists of a star symbol, the alt text should describe that in natural language).
     pub fn set_alt_text(&mut self, alt_text: Option<String>) {
-        self.inner.set_or_remove_struct(StructAttr::ALT_TEXT, alt_text.map(StructAttr::AltText));
+        self.inner
+            .set_or_remove_struct(StructAttr::ALT_TEXT, alt_text.map(StructAttr::AltText));
     }
 
     /// Set the optional alternate text that describes the text (for example, if the text
@@ -1243,13 +1365,16 @@ impl<T> Tag<T> {
     /// The expanded form of an abbreviation.
     /// Only applicable if the content of the tag is an abbreviation.
     pub fn expanded(&self) -> Option<&str> {
-        self.inner.get_struct(StructAttr::EXPANDED).map(StructAttr::unwrap_expanded)
+        self.inner
+            .get_struct(StructAttr::EXPANDED)
+            .map(StructAttr::unwrap_expanded)
     }
 
     /// Set the expanded form of an abbreviation.
     /// Only applicable if the content of the tag is an abbreviation.
     pub fn set_expanded(&mut self, expanded: Option<String>) {
-        self.inner.set_or_remove_struct(StructAttr::EXPANDED, expanded.map(StructAttr::Expanded));
+        self.inner
+            .set_or_remove_struct(StructAttr::EXPANDED, expanded.map(StructAttr::Expanded));
     }
 
     /// Set the expanded form of an abbreviation.
@@ -1263,14 +1388,19 @@ impl<T> Tag<T> {
     /// some curves that artistically represent some word. This should be the exact
     /// replacement text of the word.
     pub fn actual_text(&self) -> Option<&str> {
-        self.inner.get_struct(StructAttr::ACTUAL_TEXT).map(StructAttr::unwrap_actual_text)
+        self.inner
+            .get_struct(StructAttr::ACTUAL_TEXT)
+            .map(StructAttr::unwrap_actual_text)
     }
 
     /// Set the actual text represented by the content of this tag, i.e. if it contained
     /// some curves that artistically represent some word. This should be the exact
     /// replacement text of the word.
     pub fn set_actual_text(&mut self, actual_text: Option<String>) {
-        self.inner.set_or_remove_struct(StructAttr::ACTUAL_TEXT, actual_text.map(StructAttr::ActualText));
+        self.inner.set_or_remove_struct(
+            StructAttr::ACTUAL_TEXT,
+            actual_text.map(StructAttr::ActualText),
+        );
     }
 
     /// Set the actual text represented by the content of this tag, i.e. if it contained
@@ -1283,12 +1413,15 @@ impl<T> Tag<T> {
 
     /// The placement.
     pub fn placement(&self) -> Option<Placement> {
-        self.inner.get_layout(LayoutAttr::PLACEMENT).map(LayoutAttr::unwrap_placement)
+        self.inner
+            .get_layout(LayoutAttr::PLACEMENT)
+            .map(LayoutAttr::unwrap_placement)
     }
 
     /// Set the placement.
     pub fn set_placement(&mut self, placement: Option<Placement>) {
-        self.inner.set_or_remove_layout(LayoutAttr::PLACEMENT, placement.map(LayoutAttr::Placement));
+        self.inner
+            .set_or_remove_layout(LayoutAttr::PLACEMENT, placement.map(LayoutAttr::Placement));
     }
 
     /// Set the placement.
@@ -1299,12 +1432,17 @@ impl<T> Tag<T> {
 
     /// The writing mode.
     pub fn writing_mode(&self) -> Option<WritingMode> {
-        self.inner.get_layout(LayoutAttr::WRITING_MODE).map(LayoutAttr::unwrap_writing_mode)
+        self.inner
+            .get_layout(LayoutAttr::WRITING_MODE)
+            .map(LayoutAttr::unwrap_writing_mode)
     }
 
     /// Set the writing mode.
     pub fn set_writing_mode(&mut self, writing_mode: Option<WritingMode>) {
-        self.inner.set_or_remove_layout(LayoutAttr::WRITING_MODE, writing_mode.map(LayoutAttr::WritingMode));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::WRITING_MODE,
+            writing_mode.map(LayoutAttr::WritingMode),
+        );
     }
 
     /// Set the writing mode.
@@ -1315,12 +1453,17 @@ impl<T> Tag<T> {
 
     /// The background color.
     pub fn background_color(&self) -> Option<NaiveRgbColor> {
-        self.inner.get_layout(LayoutAttr::BACKGROUND_COLOR).map(LayoutAttr::unwrap_background_color)
+        self.inner
+            .get_layout(LayoutAttr::BACKGROUND_COLOR)
+            .map(LayoutAttr::unwrap_background_color)
     }
 
     /// Set the background color.
     pub fn set_background_color(&mut self, background_color: Option<NaiveRgbColor>) {
-        self.inner.set_or_remove_layout(LayoutAttr::BACKGROUND_COLOR, background_color.map(LayoutAttr::BackgroundColor));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::BACKGROUND_COLOR,
+            background_color.map(LayoutAttr::BackgroundColor),
+        );
     }
 
     /// Set the background color.
@@ -1331,12 +1474,17 @@ impl<T> Tag<T> {
 
     /// The border color.
     pub fn border_color(&self) -> Option<Sides<NaiveRgbColor>> {
-        self.inner.get_layout(LayoutAttr::BORDER_COLOR).map(LayoutAttr::unwrap_border_color)
+        self.inner
+            .get_layout(LayoutAttr::BORDER_COLOR)
+            .map(LayoutAttr::unwrap_border_color)
     }
 
     /// Set the border color.
     pub fn set_border_color(&mut self, border_color: Option<Sides<NaiveRgbColor>>) {
-        self.inner.set_or_remove_layout(LayoutAttr::BORDER_COLOR, border_color.map(LayoutAttr::BorderColor));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::BORDER_COLOR,
+            border_color.map(LayoutAttr::BorderColor),
+        );
     }
 
     /// Set the border color.
@@ -1347,12 +1495,17 @@ impl<T> Tag<T> {
 
     /// The way the border is drawn.
     pub fn border_style(&self) -> Option<Sides<BorderStyle>> {
-        self.inner.get_layout(LayoutAttr::BORDER_STYLE).map(LayoutAttr::unwrap_border_style)
+        self.inner
+            .get_layout(LayoutAttr::BORDER_STYLE)
+            .map(LayoutAttr::unwrap_border_style)
     }
 
     /// Set the way the border is drawn.
     pub fn set_border_style(&mut self, border_style: Option<Sides<BorderStyle>>) {
-        self.inner.set_or_remove_layout(LayoutAttr::BORDER_STYLE, border_style.map(LayoutAttr::BorderStyle));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::BORDER_STYLE,
+            border_style.map(LayoutAttr::BorderStyle),
+        );
     }
 
     /// Set the way the border is drawn.
@@ -1363,12 +1516,17 @@ impl<T> Tag<T> {
 
     /// The border width.
     pub fn border_thickness(&self) -> Option<Sides<f32>> {
-        self.inner.get_layout(LayoutAttr::BORDER_THICKNESS).map(LayoutAttr::unwrap_border_thickness)
+        self.inner
+            .get_layout(LayoutAttr::BORDER_THICKNESS)
+            .map(LayoutAttr::unwrap_border_thickness)
     }
 
     /// Set the border width.
     pub fn set_border_thickness(&mut self, border_thickness: Option<Sides<f32>>) {
-        self.inner.set_or_remove_layout(LayoutAttr::BORDER_THICKNESS, border_thickness.map(LayoutAttr::BorderThickness));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::BORDER_THICKNESS,
+            border_thickness.map(LayoutAttr::BorderThickness),
+        );
     }
 
     /// Set the border width.
@@ -1379,12 +1537,15 @@ impl<T> Tag<T> {
 
     /// The padding inside of an element.
     pub fn padding(&self) -> Option<Sides<f32>> {
-        self.inner.get_layout(LayoutAttr::PADDING).map(LayoutAttr::unwrap_padding)
+        self.inner
+            .get_layout(LayoutAttr::PADDING)
+            .map(LayoutAttr::unwrap_padding)
     }
 
     /// Set the padding inside of an element.
     pub fn set_padding(&mut self, padding: Option<Sides<f32>>) {
-        self.inner.set_or_remove_layout(LayoutAttr::PADDING, padding.map(LayoutAttr::Padding));
+        self.inner
+            .set_or_remove_layout(LayoutAttr::PADDING, padding.map(LayoutAttr::Padding));
     }
 
     /// Set the padding inside of an element.
@@ -1395,12 +1556,15 @@ impl<T> Tag<T> {
 
     /// The color of text, borders, and text decorations.
     pub fn color(&self) -> Option<NaiveRgbColor> {
-        self.inner.get_layout(LayoutAttr::COLOR).map(LayoutAttr::unwrap_color)
+        self.inner
+            .get_layout(LayoutAttr::COLOR)
+            .map(LayoutAttr::unwrap_color)
     }
 
     /// Set the color of text, borders, and text decorations.
     pub fn set_color(&mut self, color: Option<NaiveRgbColor>) {
-        self.inner.set_or_remove_layout(LayoutAttr::COLOR, color.map(LayoutAttr::Color));
+        self.inner
+            .set_or_remove_layout(LayoutAttr::COLOR, color.map(LayoutAttr::Color));
     }
 
     /// Set the color of text, borders, and text decorations.
@@ -1411,12 +1575,17 @@ impl<T> Tag<T> {
 
     /// The distance by which the baseline shall be shifted from the default position.
     pub fn baseline_shift(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::BASELINE_SHIFT).map(LayoutAttr::unwrap_baseline_shift)
+        self.inner
+            .get_layout(LayoutAttr::BASELINE_SHIFT)
+            .map(LayoutAttr::unwrap_baseline_shift)
     }
 
     /// Set the distance by which the baseline shall be shifted from the default position.
     pub fn set_baseline_shift(&mut self, baseline_shift: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::BASELINE_SHIFT, baseline_shift.map(LayoutAttr::BaselineShift));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::BASELINE_SHIFT,
+            baseline_shift.map(LayoutAttr::BaselineShift),
+        );
     }
 
     /// Set the distance by which the baseline shall be shifted from the default position.
@@ -1427,12 +1596,17 @@ impl<T> Tag<T> {
 
     /// The height of each line in an element on the block axis.
     pub fn line_height(&self) -> Option<LineHeight> {
-        self.inner.get_layout(LayoutAttr::LINE_HEIGHT).map(LayoutAttr::unwrap_line_height)
+        self.inner
+            .get_layout(LayoutAttr::LINE_HEIGHT)
+            .map(LayoutAttr::unwrap_line_height)
     }
 
     /// Set the height of each line in an element on the block axis.
     pub fn set_line_height(&mut self, line_height: Option<LineHeight>) {
-        self.inner.set_or_remove_layout(LayoutAttr::LINE_HEIGHT, line_height.map(LayoutAttr::LineHeight));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::LINE_HEIGHT,
+            line_height.map(LayoutAttr::LineHeight),
+        );
     }
 
     /// Set the height of each line in an element on the block axis.
@@ -1443,64 +1617,99 @@ impl<T> Tag<T> {
 
     /// The color of the text decoration, overriding the fill color.
     pub fn text_decoration_color(&self) -> Option<NaiveRgbColor> {
-        self.inner.get_layout(LayoutAttr::TEXT_DECORATION_COLOR).map(LayoutAttr::unwrap_text_decoration_color)
+        self.inner
+            .get_layout(LayoutAttr::TEXT_DECORATION_COLOR)
+            .map(LayoutAttr::unwrap_text_decoration_color)
     }
 
     /// Set the color of the text decoration, overriding the fill color.
     pub fn set_text_decoration_color(&mut self, text_decoration_color: Option<NaiveRgbColor>) {
-        self.inner.set_or_remove_layout(LayoutAttr::TEXT_DECORATION_COLOR, text_decoration_color.map(LayoutAttr::TextDecorationColor));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::TEXT_DECORATION_COLOR,
+            text_decoration_color.map(LayoutAttr::TextDecorationColor),
+        );
     }
 
     /// Set the color of the text decoration, overriding the fill color.
-    pub fn with_text_decoration_color(mut self, text_decoration_color: Option<NaiveRgbColor>) -> Self {
+    pub fn with_text_decoration_color(
+        mut self,
+        text_decoration_color: Option<NaiveRgbColor>,
+    ) -> Self {
         self.set_text_decoration_color(text_decoration_color);
         self
     }
 
     /// The width of the text decoration line.
     pub fn text_decoration_thickness(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::TEXT_DECORATION_THICKNESS).map(LayoutAttr::unwrap_text_decoration_thickness)
+        self.inner
+            .get_layout(LayoutAttr::TEXT_DECORATION_THICKNESS)
+            .map(LayoutAttr::unwrap_text_decoration_thickness)
     }
 
     /// Set the width of the text decoration line.
     pub fn set_text_decoration_thickness(&mut self, text_decoration_thickness: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::TEXT_DECORATION_THICKNESS, text_decoration_thickness.map(LayoutAttr::TextDecorationThickness));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::TEXT_DECORATION_THICKNESS,
+            text_decoration_thickness.map(LayoutAttr::TextDecorationThickness),
+        );
     }
 
     /// Set the width of the text decoration line.
-    pub fn with_text_decoration_thickness(mut self, text_decoration_thickness: Option<f32>) -> Self {
+    pub fn with_text_decoration_thickness(
+        mut self,
+        text_decoration_thickness: Option<f32>,
+    ) -> Self {
         self.set_text_decoration_thickness(text_decoration_thickness);
         self
     }
 
     /// The kind of text decoration.
     pub fn text_decoration_type(&self) -> Option<TextDecorationType> {
-        self.inner.get_layout(LayoutAttr::TEXT_DECORATION_TYPE).map(LayoutAttr::unwrap_text_decoration_type)
+        self.inner
+            .get_layout(LayoutAttr::TEXT_DECORATION_TYPE)
+            .map(LayoutAttr::unwrap_text_decoration_type)
     }
 
     /// Set the kind of text decoration.
     pub fn set_text_decoration_type(&mut self, text_decoration_type: Option<TextDecorationType>) {
-        self.inner.set_or_remove_layout(LayoutAttr::TEXT_DECORATION_TYPE, text_decoration_type.map(LayoutAttr::TextDecorationType));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::TEXT_DECORATION_TYPE,
+            text_decoration_type.map(LayoutAttr::TextDecorationType),
+        );
     }
 
     /// Set the kind of text decoration.
-    pub fn with_text_decoration_type(mut self, text_decoration_type: Option<TextDecorationType>) -> Self {
+    pub fn with_text_decoration_type(
+        mut self,
+        text_decoration_type: Option<TextDecorationType>,
+    ) -> Self {
         self.set_text_decoration_type(text_decoration_type);
         self
     }
 
     /// How the glyphs are rotated in a vertical writing mode.
     pub fn glyph_orientation_vertical(&self) -> Option<GlyphOrientationVertical> {
-        self.inner.get_layout(LayoutAttr::GLYPH_ORIENTATION_VERTICAL).map(LayoutAttr::unwrap_glyph_orientation_vertical)
+        self.inner
+            .get_layout(LayoutAttr::GLYPH_ORIENTATION_VERTICAL)
+            .map(LayoutAttr::unwrap_glyph_orientation_vertical)
     }
 
     /// Set how the glyphs are rotated in a vertical writing mode.
-    pub fn set_glyph_orientation_vertical(&mut self, glyph_orientation_vertical: Option<GlyphOrientationVertical>) {
-        self.inner.set_or_remove_layout(LayoutAttr::GLYPH_ORIENTATION_VERTICAL, glyph_orientation_vertical.map(LayoutAttr::GlyphOrientationVertical));
+    pub fn set_glyph_orientation_vertical(
+        &mut self,
+        glyph_orientation_vertical: Option<GlyphOrientationVertical>,
+    ) {
+        self.inner.set_or_remove_layout(
+            LayoutAttr::GLYPH_ORIENTATION_VERTICAL,
+            glyph_orientation_vertical.map(LayoutAttr::GlyphOrientationVertical),
+        );
     }
 
     /// Set how the glyphs are rotated in a vertical writing mode.
-    pub fn with_glyph_orientation_vertical(mut self, glyph_orientation_vertical: Option<GlyphOrientationVertical>) -> Self {
+    pub fn with_glyph_orientation_vertical(
+        mut self,
+        glyph_orientation_vertical: Option<GlyphOrientationVertical>,
+    ) -> Self {
         self.set_glyph_orientation_vertical(glyph_orientation_vertical);
         self
     }
@@ -1710,25 +1919,16 @@ pub mod kind {
     /// Encloses content that is emphasized, most commonly *italic* text.
     #[derive(Clone, Debug, PartialEq)]
     pub struct Em;
-
 }
 
-impl From<Tag<kind::Part>> for TagKind {
-    fn from(value: Tag<kind::Part>) -> Self {
-        Self::Part(value)
-    }
-}
+impl_from_tag!(Part);
 impl Tag<kind::Part> {
     /// A part of a document that may contain multiple articles or sections.
     #[allow(non_upper_case_globals)]
     pub const Part: Tag<kind::Part> = Tag::new();
 }
 
-impl From<Tag<kind::Article>> for TagKind {
-    fn from(value: Tag<kind::Article>) -> Self {
-        Self::Article(value)
-    }
-}
+impl_from_tag!(Article);
 impl Tag<kind::Article> {
     /// An article with largely self-contained content.
     #[allow(non_upper_case_globals)]
@@ -1736,12 +1936,17 @@ impl Tag<kind::Article> {
 
     /// The number of columns in the grouping element.
     pub fn column_count(&self) -> Option<NonZeroU32> {
-        self.inner.get_layout(LayoutAttr::COLUMN_COUNT).map(LayoutAttr::unwrap_column_count)
+        self.inner
+            .get_layout(LayoutAttr::COLUMN_COUNT)
+            .map(LayoutAttr::unwrap_column_count)
     }
 
     /// Set the number of columns in the grouping element.
     pub fn set_column_count(&mut self, column_count: Option<NonZeroU32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::COLUMN_COUNT, column_count.map(LayoutAttr::ColumnCount));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::COLUMN_COUNT,
+            column_count.map(LayoutAttr::ColumnCount),
+        );
     }
 
     /// Set the number of columns in the grouping element.
@@ -1752,12 +1957,17 @@ impl Tag<kind::Article> {
 
     /// The width of the gaps between columns in the grouping element.
     pub fn column_gap(&self) -> Option<&ColumnDimensions> {
-        self.inner.get_layout(LayoutAttr::COLUMN_GAP).map(LayoutAttr::unwrap_column_gap)
+        self.inner
+            .get_layout(LayoutAttr::COLUMN_GAP)
+            .map(LayoutAttr::unwrap_column_gap)
     }
 
     /// Set the width of the gaps between columns in the grouping element.
     pub fn set_column_gap(&mut self, column_gap: Option<ColumnDimensions>) {
-        self.inner.set_or_remove_layout(LayoutAttr::COLUMN_GAP, column_gap.map(LayoutAttr::ColumnGap));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::COLUMN_GAP,
+            column_gap.map(LayoutAttr::ColumnGap),
+        );
     }
 
     /// Set the width of the gaps between columns in the grouping element.
@@ -1768,12 +1978,17 @@ impl Tag<kind::Article> {
 
     /// The width of the columns in the grouping element.
     pub fn column_widths(&self) -> Option<&ColumnDimensions> {
-        self.inner.get_layout(LayoutAttr::COLUMN_WIDTHS).map(LayoutAttr::unwrap_column_widths)
+        self.inner
+            .get_layout(LayoutAttr::COLUMN_WIDTHS)
+            .map(LayoutAttr::unwrap_column_widths)
     }
 
     /// Set the width of the columns in the grouping element.
     pub fn set_column_widths(&mut self, column_widths: Option<ColumnDimensions>) {
-        self.inner.set_or_remove_layout(LayoutAttr::COLUMN_WIDTHS, column_widths.map(LayoutAttr::ColumnWidths));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::COLUMN_WIDTHS,
+            column_widths.map(LayoutAttr::ColumnWidths),
+        );
     }
 
     /// Set the width of the columns in the grouping element.
@@ -1783,11 +1998,7 @@ impl Tag<kind::Article> {
     }
 }
 
-impl From<Tag<kind::Section>> for TagKind {
-    fn from(value: Tag<kind::Section>) -> Self {
-        Self::Section(value)
-    }
-}
+impl_from_tag!(Section);
 impl Tag<kind::Section> {
     /// Section of a larger document.
     #[allow(non_upper_case_globals)]
@@ -1795,12 +2006,17 @@ impl Tag<kind::Section> {
 
     /// The number of columns in the grouping element.
     pub fn column_count(&self) -> Option<NonZeroU32> {
-        self.inner.get_layout(LayoutAttr::COLUMN_COUNT).map(LayoutAttr::unwrap_column_count)
+        self.inner
+            .get_layout(LayoutAttr::COLUMN_COUNT)
+            .map(LayoutAttr::unwrap_column_count)
     }
 
     /// Set the number of columns in the grouping element.
     pub fn set_column_count(&mut self, column_count: Option<NonZeroU32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::COLUMN_COUNT, column_count.map(LayoutAttr::ColumnCount));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::COLUMN_COUNT,
+            column_count.map(LayoutAttr::ColumnCount),
+        );
     }
 
     /// Set the number of columns in the grouping element.
@@ -1811,12 +2027,17 @@ impl Tag<kind::Section> {
 
     /// The width of the gaps between columns in the grouping element.
     pub fn column_gap(&self) -> Option<&ColumnDimensions> {
-        self.inner.get_layout(LayoutAttr::COLUMN_GAP).map(LayoutAttr::unwrap_column_gap)
+        self.inner
+            .get_layout(LayoutAttr::COLUMN_GAP)
+            .map(LayoutAttr::unwrap_column_gap)
     }
 
     /// Set the width of the gaps between columns in the grouping element.
     pub fn set_column_gap(&mut self, column_gap: Option<ColumnDimensions>) {
-        self.inner.set_or_remove_layout(LayoutAttr::COLUMN_GAP, column_gap.map(LayoutAttr::ColumnGap));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::COLUMN_GAP,
+            column_gap.map(LayoutAttr::ColumnGap),
+        );
     }
 
     /// Set the width of the gaps between columns in the grouping element.
@@ -1827,12 +2048,17 @@ impl Tag<kind::Section> {
 
     /// The width of the columns in the grouping element.
     pub fn column_widths(&self) -> Option<&ColumnDimensions> {
-        self.inner.get_layout(LayoutAttr::COLUMN_WIDTHS).map(LayoutAttr::unwrap_column_widths)
+        self.inner
+            .get_layout(LayoutAttr::COLUMN_WIDTHS)
+            .map(LayoutAttr::unwrap_column_widths)
     }
 
     /// Set the width of the columns in the grouping element.
     pub fn set_column_widths(&mut self, column_widths: Option<ColumnDimensions>) {
-        self.inner.set_or_remove_layout(LayoutAttr::COLUMN_WIDTHS, column_widths.map(LayoutAttr::ColumnWidths));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::COLUMN_WIDTHS,
+            column_widths.map(LayoutAttr::ColumnWidths),
+        );
     }
 
     /// Set the width of the columns in the grouping element.
@@ -1842,11 +2068,7 @@ impl Tag<kind::Section> {
     }
 }
 
-impl From<Tag<kind::Div>> for TagKind {
-    fn from(value: Tag<kind::Div>) -> Self {
-        Self::Div(value)
-    }
-}
+impl_from_tag!(Div);
 impl Tag<kind::Div> {
     /// A generic block-level grouping element.
     #[allow(non_upper_case_globals)]
@@ -1854,12 +2076,17 @@ impl Tag<kind::Div> {
 
     /// The number of columns in the grouping element.
     pub fn column_count(&self) -> Option<NonZeroU32> {
-        self.inner.get_layout(LayoutAttr::COLUMN_COUNT).map(LayoutAttr::unwrap_column_count)
+        self.inner
+            .get_layout(LayoutAttr::COLUMN_COUNT)
+            .map(LayoutAttr::unwrap_column_count)
     }
 
     /// Set the number of columns in the grouping element.
     pub fn set_column_count(&mut self, column_count: Option<NonZeroU32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::COLUMN_COUNT, column_count.map(LayoutAttr::ColumnCount));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::COLUMN_COUNT,
+            column_count.map(LayoutAttr::ColumnCount),
+        );
     }
 
     /// Set the number of columns in the grouping element.
@@ -1870,12 +2097,17 @@ impl Tag<kind::Div> {
 
     /// The width of the gaps between columns in the grouping element.
     pub fn column_gap(&self) -> Option<&ColumnDimensions> {
-        self.inner.get_layout(LayoutAttr::COLUMN_GAP).map(LayoutAttr::unwrap_column_gap)
+        self.inner
+            .get_layout(LayoutAttr::COLUMN_GAP)
+            .map(LayoutAttr::unwrap_column_gap)
     }
 
     /// Set the width of the gaps between columns in the grouping element.
     pub fn set_column_gap(&mut self, column_gap: Option<ColumnDimensions>) {
-        self.inner.set_or_remove_layout(LayoutAttr::COLUMN_GAP, column_gap.map(LayoutAttr::ColumnGap));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::COLUMN_GAP,
+            column_gap.map(LayoutAttr::ColumnGap),
+        );
     }
 
     /// Set the width of the gaps between columns in the grouping element.
@@ -1886,12 +2118,17 @@ impl Tag<kind::Div> {
 
     /// The width of the columns in the grouping element.
     pub fn column_widths(&self) -> Option<&ColumnDimensions> {
-        self.inner.get_layout(LayoutAttr::COLUMN_WIDTHS).map(LayoutAttr::unwrap_column_widths)
+        self.inner
+            .get_layout(LayoutAttr::COLUMN_WIDTHS)
+            .map(LayoutAttr::unwrap_column_widths)
     }
 
     /// Set the width of the columns in the grouping element.
     pub fn set_column_widths(&mut self, column_widths: Option<ColumnDimensions>) {
-        self.inner.set_or_remove_layout(LayoutAttr::COLUMN_WIDTHS, column_widths.map(LayoutAttr::ColumnWidths));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::COLUMN_WIDTHS,
+            column_widths.map(LayoutAttr::ColumnWidths),
+        );
     }
 
     /// Set the width of the columns in the grouping element.
@@ -1901,22 +2138,14 @@ impl Tag<kind::Div> {
     }
 }
 
-impl From<Tag<kind::BlockQuote>> for TagKind {
-    fn from(value: Tag<kind::BlockQuote>) -> Self {
-        Self::BlockQuote(value)
-    }
-}
+impl_from_tag!(BlockQuote);
 impl Tag<kind::BlockQuote> {
     /// A paragraph-level quote.
     #[allow(non_upper_case_globals)]
     pub const BlockQuote: Tag<kind::BlockQuote> = Tag::new();
 }
 
-impl From<Tag<kind::Caption>> for TagKind {
-    fn from(value: Tag<kind::Caption>) -> Self {
-        Self::Caption(value)
-    }
-}
+impl_from_tag!(Caption);
 impl Tag<kind::Caption> {
     /// An image or figure caption.
     ///
@@ -1926,11 +2155,7 @@ impl Tag<kind::Caption> {
     pub const Caption: Tag<kind::Caption> = Tag::new();
 }
 
-impl From<Tag<kind::TOC>> for TagKind {
-    fn from(value: Tag<kind::TOC>) -> Self {
-        Self::TOC(value)
-    }
-}
+impl_from_tag!(TOC);
 impl Tag<kind::TOC> {
     /// Table of contents.
     ///
@@ -1939,11 +2164,7 @@ impl Tag<kind::TOC> {
     pub const TOC: Tag<kind::TOC> = Tag::new();
 }
 
-impl From<Tag<kind::TOCI>> for TagKind {
-    fn from(value: Tag<kind::TOCI>) -> Self {
-        Self::TOCI(value)
-    }
-}
+impl_from_tag!(TOCI);
 impl Tag<kind::TOCI> {
     /// Item in the table of contents.
     ///
@@ -1953,11 +2174,7 @@ impl Tag<kind::TOCI> {
     pub const TOCI: Tag<kind::TOCI> = Tag::new();
 }
 
-impl From<Tag<kind::Index>> for TagKind {
-    fn from(value: Tag<kind::Index>) -> Self {
-        Self::Index(value)
-    }
-}
+impl_from_tag!(Index);
 impl Tag<kind::Index> {
     /// Index of the key terms in the document.
     ///
@@ -1967,11 +2184,7 @@ impl Tag<kind::Index> {
     pub const Index: Tag<kind::Index> = Tag::new();
 }
 
-impl From<Tag<kind::P>> for TagKind {
-    fn from(value: Tag<kind::P>) -> Self {
-        Self::P(value)
-    }
-}
+impl_from_tag!(P);
 impl Tag<kind::P> {
     /// A paragraph.
     #[allow(non_upper_case_globals)]
@@ -1979,12 +2192,17 @@ impl Tag<kind::P> {
 
     /// The spacing before the block-level element.
     pub fn space_before(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::SPACE_BEFORE).map(LayoutAttr::unwrap_space_before)
+        self.inner
+            .get_layout(LayoutAttr::SPACE_BEFORE)
+            .map(LayoutAttr::unwrap_space_before)
     }
 
     /// Set the spacing before the block-level element.
     pub fn set_space_before(&mut self, space_before: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::SPACE_BEFORE, space_before.map(LayoutAttr::SpaceBefore));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::SPACE_BEFORE,
+            space_before.map(LayoutAttr::SpaceBefore),
+        );
     }
 
     /// Set the spacing before the block-level element.
@@ -1995,12 +2213,17 @@ impl Tag<kind::P> {
 
     /// The spacing after the block-level element.
     pub fn space_after(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::SPACE_AFTER).map(LayoutAttr::unwrap_space_after)
+        self.inner
+            .get_layout(LayoutAttr::SPACE_AFTER)
+            .map(LayoutAttr::unwrap_space_after)
     }
 
     /// Set the spacing after the block-level element.
     pub fn set_space_after(&mut self, space_after: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::SPACE_AFTER, space_after.map(LayoutAttr::SpaceAfter));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::SPACE_AFTER,
+            space_after.map(LayoutAttr::SpaceAfter),
+        );
     }
 
     /// Set the spacing after the block-level element.
@@ -2011,12 +2234,17 @@ impl Tag<kind::P> {
 
     /// The spacing between the start inline edge of the element and the parent.
     pub fn start_indent(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::START_INDENT).map(LayoutAttr::unwrap_start_indent)
+        self.inner
+            .get_layout(LayoutAttr::START_INDENT)
+            .map(LayoutAttr::unwrap_start_indent)
     }
 
     /// Set the spacing between the start inline edge of the element and the parent.
     pub fn set_start_indent(&mut self, start_indent: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::START_INDENT, start_indent.map(LayoutAttr::StartIndent));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::START_INDENT,
+            start_indent.map(LayoutAttr::StartIndent),
+        );
     }
 
     /// Set the spacing between the start inline edge of the element and the parent.
@@ -2027,12 +2255,17 @@ impl Tag<kind::P> {
 
     /// The spacing between the end inline edge of the element and the parent.
     pub fn end_indent(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::END_INDENT).map(LayoutAttr::unwrap_end_indent)
+        self.inner
+            .get_layout(LayoutAttr::END_INDENT)
+            .map(LayoutAttr::unwrap_end_indent)
     }
 
     /// Set the spacing between the end inline edge of the element and the parent.
     pub fn set_end_indent(&mut self, end_indent: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::END_INDENT, end_indent.map(LayoutAttr::EndIndent));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::END_INDENT,
+            end_indent.map(LayoutAttr::EndIndent),
+        );
     }
 
     /// Set the spacing between the end inline edge of the element and the parent.
@@ -2044,13 +2277,18 @@ impl Tag<kind::P> {
     /// The amount the first line of text in a block-level element is indented. Only
     /// applicable to paragraph-like elements with non-block-level elements.
     pub fn text_indent(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::TEXT_INDENT).map(LayoutAttr::unwrap_text_indent)
+        self.inner
+            .get_layout(LayoutAttr::TEXT_INDENT)
+            .map(LayoutAttr::unwrap_text_indent)
     }
 
     /// Set the amount the first line of text in a block-level element is indented. Only
     /// applicable to paragraph-like elements with non-block-level elements.
     pub fn set_text_indent(&mut self, text_indent: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::TEXT_INDENT, text_indent.map(LayoutAttr::TextIndent));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::TEXT_INDENT,
+            text_indent.map(LayoutAttr::TextIndent),
+        );
     }
 
     /// Set the amount the first line of text in a block-level element is indented. Only
@@ -2062,12 +2300,17 @@ impl Tag<kind::P> {
 
     /// The text alignment.
     pub fn text_align(&self) -> Option<TextAlign> {
-        self.inner.get_layout(LayoutAttr::TEXT_ALIGN).map(LayoutAttr::unwrap_text_align)
+        self.inner
+            .get_layout(LayoutAttr::TEXT_ALIGN)
+            .map(LayoutAttr::unwrap_text_align)
     }
 
     /// Set the text alignment.
     pub fn set_text_align(&mut self, text_align: Option<TextAlign>) {
-        self.inner.set_or_remove_layout(LayoutAttr::TEXT_ALIGN, text_align.map(LayoutAttr::TextAlign));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::TEXT_ALIGN,
+            text_align.map(LayoutAttr::TextAlign),
+        );
     }
 
     /// Set the text alignment.
@@ -2077,11 +2320,7 @@ impl Tag<kind::P> {
     }
 }
 
-impl From<Tag<kind::Hn>> for TagKind {
-    fn from(value: Tag<kind::Hn>) -> Self {
-        Self::Hn(value)
-    }
-}
+impl_from_tag!(Hn);
 impl Tag<kind::Hn> {
     /// Heading level `n`, including an optional title of the heading.
     ///
@@ -2096,7 +2335,10 @@ impl Tag<kind::Hn> {
 
     /// The heading level
     pub fn level(&self) -> NonZeroU16 {
-        self.inner.get_struct(StructAttr::HEADING_LEVEL).unwrap().unwrap_level()
+        self.inner
+            .get_struct(StructAttr::HEADING_LEVEL)
+            .unwrap()
+            .unwrap_level()
     }
 
     /// Set the heading level
@@ -2112,12 +2354,15 @@ impl Tag<kind::Hn> {
 
     /// The title, characterizing a specific tag such as `"Chapter 1"`.
     pub fn title(&self) -> Option<&str> {
-        self.inner.get_struct(StructAttr::TITLE).map(StructAttr::unwrap_title)
+        self.inner
+            .get_struct(StructAttr::TITLE)
+            .map(StructAttr::unwrap_title)
     }
 
     /// Set the title, characterizing a specific tag such as `"Chapter 1"`.
     pub fn set_title(&mut self, title: Option<String>) {
-        self.inner.set_or_remove_struct(StructAttr::TITLE, title.map(StructAttr::Title));
+        self.inner
+            .set_or_remove_struct(StructAttr::TITLE, title.map(StructAttr::Title));
     }
 
     /// Set the title, characterizing a specific tag such as `"Chapter 1"`.
@@ -2128,12 +2373,17 @@ impl Tag<kind::Hn> {
 
     /// The spacing before the block-level element.
     pub fn space_before(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::SPACE_BEFORE).map(LayoutAttr::unwrap_space_before)
+        self.inner
+            .get_layout(LayoutAttr::SPACE_BEFORE)
+            .map(LayoutAttr::unwrap_space_before)
     }
 
     /// Set the spacing before the block-level element.
     pub fn set_space_before(&mut self, space_before: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::SPACE_BEFORE, space_before.map(LayoutAttr::SpaceBefore));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::SPACE_BEFORE,
+            space_before.map(LayoutAttr::SpaceBefore),
+        );
     }
 
     /// Set the spacing before the block-level element.
@@ -2144,12 +2394,17 @@ impl Tag<kind::Hn> {
 
     /// The spacing after the block-level element.
     pub fn space_after(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::SPACE_AFTER).map(LayoutAttr::unwrap_space_after)
+        self.inner
+            .get_layout(LayoutAttr::SPACE_AFTER)
+            .map(LayoutAttr::unwrap_space_after)
     }
 
     /// Set the spacing after the block-level element.
     pub fn set_space_after(&mut self, space_after: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::SPACE_AFTER, space_after.map(LayoutAttr::SpaceAfter));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::SPACE_AFTER,
+            space_after.map(LayoutAttr::SpaceAfter),
+        );
     }
 
     /// Set the spacing after the block-level element.
@@ -2160,12 +2415,17 @@ impl Tag<kind::Hn> {
 
     /// The spacing between the start inline edge of the element and the parent.
     pub fn start_indent(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::START_INDENT).map(LayoutAttr::unwrap_start_indent)
+        self.inner
+            .get_layout(LayoutAttr::START_INDENT)
+            .map(LayoutAttr::unwrap_start_indent)
     }
 
     /// Set the spacing between the start inline edge of the element and the parent.
     pub fn set_start_indent(&mut self, start_indent: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::START_INDENT, start_indent.map(LayoutAttr::StartIndent));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::START_INDENT,
+            start_indent.map(LayoutAttr::StartIndent),
+        );
     }
 
     /// Set the spacing between the start inline edge of the element and the parent.
@@ -2176,12 +2436,17 @@ impl Tag<kind::Hn> {
 
     /// The spacing between the end inline edge of the element and the parent.
     pub fn end_indent(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::END_INDENT).map(LayoutAttr::unwrap_end_indent)
+        self.inner
+            .get_layout(LayoutAttr::END_INDENT)
+            .map(LayoutAttr::unwrap_end_indent)
     }
 
     /// Set the spacing between the end inline edge of the element and the parent.
     pub fn set_end_indent(&mut self, end_indent: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::END_INDENT, end_indent.map(LayoutAttr::EndIndent));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::END_INDENT,
+            end_indent.map(LayoutAttr::EndIndent),
+        );
     }
 
     /// Set the spacing between the end inline edge of the element and the parent.
@@ -2193,13 +2458,18 @@ impl Tag<kind::Hn> {
     /// The amount the first line of text in a block-level element is indented. Only
     /// applicable to paragraph-like elements with non-block-level elements.
     pub fn text_indent(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::TEXT_INDENT).map(LayoutAttr::unwrap_text_indent)
+        self.inner
+            .get_layout(LayoutAttr::TEXT_INDENT)
+            .map(LayoutAttr::unwrap_text_indent)
     }
 
     /// Set the amount the first line of text in a block-level element is indented. Only
     /// applicable to paragraph-like elements with non-block-level elements.
     pub fn set_text_indent(&mut self, text_indent: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::TEXT_INDENT, text_indent.map(LayoutAttr::TextIndent));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::TEXT_INDENT,
+            text_indent.map(LayoutAttr::TextIndent),
+        );
     }
 
     /// Set the amount the first line of text in a block-level element is indented. Only
@@ -2211,12 +2481,17 @@ impl Tag<kind::Hn> {
 
     /// The text alignment.
     pub fn text_align(&self) -> Option<TextAlign> {
-        self.inner.get_layout(LayoutAttr::TEXT_ALIGN).map(LayoutAttr::unwrap_text_align)
+        self.inner
+            .get_layout(LayoutAttr::TEXT_ALIGN)
+            .map(LayoutAttr::unwrap_text_align)
     }
 
     /// Set the text alignment.
     pub fn set_text_align(&mut self, text_align: Option<TextAlign>) {
-        self.inner.set_or_remove_layout(LayoutAttr::TEXT_ALIGN, text_align.map(LayoutAttr::TextAlign));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::TEXT_ALIGN,
+            text_align.map(LayoutAttr::TextAlign),
+        );
     }
 
     /// Set the text alignment.
@@ -2226,11 +2501,7 @@ impl Tag<kind::Hn> {
     }
 }
 
-impl From<Tag<kind::L>> for TagKind {
-    fn from(value: Tag<kind::L>) -> Self {
-        Self::L(value)
-    }
-}
+impl_from_tag!(L);
 impl Tag<kind::L> {
     /// A list.
     ///
@@ -2246,7 +2517,10 @@ impl Tag<kind::L> {
 
     /// The list numbering.
     pub fn numbering(&self) -> ListNumbering {
-        self.inner.get_list(ListAttr::NUMBERING).unwrap().unwrap_numbering()
+        self.inner
+            .get_list(ListAttr::NUMBERING)
+            .unwrap()
+            .unwrap_numbering()
     }
 
     /// Set the list numbering.
@@ -2262,12 +2536,17 @@ impl Tag<kind::L> {
 
     /// The spacing before the block-level element.
     pub fn space_before(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::SPACE_BEFORE).map(LayoutAttr::unwrap_space_before)
+        self.inner
+            .get_layout(LayoutAttr::SPACE_BEFORE)
+            .map(LayoutAttr::unwrap_space_before)
     }
 
     /// Set the spacing before the block-level element.
     pub fn set_space_before(&mut self, space_before: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::SPACE_BEFORE, space_before.map(LayoutAttr::SpaceBefore));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::SPACE_BEFORE,
+            space_before.map(LayoutAttr::SpaceBefore),
+        );
     }
 
     /// Set the spacing before the block-level element.
@@ -2278,12 +2557,17 @@ impl Tag<kind::L> {
 
     /// The spacing after the block-level element.
     pub fn space_after(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::SPACE_AFTER).map(LayoutAttr::unwrap_space_after)
+        self.inner
+            .get_layout(LayoutAttr::SPACE_AFTER)
+            .map(LayoutAttr::unwrap_space_after)
     }
 
     /// Set the spacing after the block-level element.
     pub fn set_space_after(&mut self, space_after: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::SPACE_AFTER, space_after.map(LayoutAttr::SpaceAfter));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::SPACE_AFTER,
+            space_after.map(LayoutAttr::SpaceAfter),
+        );
     }
 
     /// Set the spacing after the block-level element.
@@ -2294,12 +2578,17 @@ impl Tag<kind::L> {
 
     /// The spacing between the start inline edge of the element and the parent.
     pub fn start_indent(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::START_INDENT).map(LayoutAttr::unwrap_start_indent)
+        self.inner
+            .get_layout(LayoutAttr::START_INDENT)
+            .map(LayoutAttr::unwrap_start_indent)
     }
 
     /// Set the spacing between the start inline edge of the element and the parent.
     pub fn set_start_indent(&mut self, start_indent: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::START_INDENT, start_indent.map(LayoutAttr::StartIndent));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::START_INDENT,
+            start_indent.map(LayoutAttr::StartIndent),
+        );
     }
 
     /// Set the spacing between the start inline edge of the element and the parent.
@@ -2310,12 +2599,17 @@ impl Tag<kind::L> {
 
     /// The spacing between the end inline edge of the element and the parent.
     pub fn end_indent(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::END_INDENT).map(LayoutAttr::unwrap_end_indent)
+        self.inner
+            .get_layout(LayoutAttr::END_INDENT)
+            .map(LayoutAttr::unwrap_end_indent)
     }
 
     /// Set the spacing between the end inline edge of the element and the parent.
     pub fn set_end_indent(&mut self, end_indent: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::END_INDENT, end_indent.map(LayoutAttr::EndIndent));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::END_INDENT,
+            end_indent.map(LayoutAttr::EndIndent),
+        );
     }
 
     /// Set the spacing between the end inline edge of the element and the parent.
@@ -2327,13 +2621,18 @@ impl Tag<kind::L> {
     /// The amount the first line of text in a block-level element is indented. Only
     /// applicable to paragraph-like elements with non-block-level elements.
     pub fn text_indent(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::TEXT_INDENT).map(LayoutAttr::unwrap_text_indent)
+        self.inner
+            .get_layout(LayoutAttr::TEXT_INDENT)
+            .map(LayoutAttr::unwrap_text_indent)
     }
 
     /// Set the amount the first line of text in a block-level element is indented. Only
     /// applicable to paragraph-like elements with non-block-level elements.
     pub fn set_text_indent(&mut self, text_indent: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::TEXT_INDENT, text_indent.map(LayoutAttr::TextIndent));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::TEXT_INDENT,
+            text_indent.map(LayoutAttr::TextIndent),
+        );
     }
 
     /// Set the amount the first line of text in a block-level element is indented. Only
@@ -2345,12 +2644,17 @@ impl Tag<kind::L> {
 
     /// The text alignment.
     pub fn text_align(&self) -> Option<TextAlign> {
-        self.inner.get_layout(LayoutAttr::TEXT_ALIGN).map(LayoutAttr::unwrap_text_align)
+        self.inner
+            .get_layout(LayoutAttr::TEXT_ALIGN)
+            .map(LayoutAttr::unwrap_text_align)
     }
 
     /// Set the text alignment.
     pub fn set_text_align(&mut self, text_align: Option<TextAlign>) {
-        self.inner.set_or_remove_layout(LayoutAttr::TEXT_ALIGN, text_align.map(LayoutAttr::TextAlign));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::TEXT_ALIGN,
+            text_align.map(LayoutAttr::TextAlign),
+        );
     }
 
     /// Set the text alignment.
@@ -2360,11 +2664,7 @@ impl Tag<kind::L> {
     }
 }
 
-impl From<Tag<kind::LI>> for TagKind {
-    fn from(value: Tag<kind::LI>) -> Self {
-        Self::LI(value)
-    }
-}
+impl_from_tag!(LI);
 impl Tag<kind::LI> {
     /// A list item.
     ///
@@ -2374,12 +2674,17 @@ impl Tag<kind::LI> {
 
     /// The spacing before the block-level element.
     pub fn space_before(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::SPACE_BEFORE).map(LayoutAttr::unwrap_space_before)
+        self.inner
+            .get_layout(LayoutAttr::SPACE_BEFORE)
+            .map(LayoutAttr::unwrap_space_before)
     }
 
     /// Set the spacing before the block-level element.
     pub fn set_space_before(&mut self, space_before: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::SPACE_BEFORE, space_before.map(LayoutAttr::SpaceBefore));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::SPACE_BEFORE,
+            space_before.map(LayoutAttr::SpaceBefore),
+        );
     }
 
     /// Set the spacing before the block-level element.
@@ -2390,12 +2695,17 @@ impl Tag<kind::LI> {
 
     /// The spacing after the block-level element.
     pub fn space_after(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::SPACE_AFTER).map(LayoutAttr::unwrap_space_after)
+        self.inner
+            .get_layout(LayoutAttr::SPACE_AFTER)
+            .map(LayoutAttr::unwrap_space_after)
     }
 
     /// Set the spacing after the block-level element.
     pub fn set_space_after(&mut self, space_after: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::SPACE_AFTER, space_after.map(LayoutAttr::SpaceAfter));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::SPACE_AFTER,
+            space_after.map(LayoutAttr::SpaceAfter),
+        );
     }
 
     /// Set the spacing after the block-level element.
@@ -2406,12 +2716,17 @@ impl Tag<kind::LI> {
 
     /// The spacing between the start inline edge of the element and the parent.
     pub fn start_indent(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::START_INDENT).map(LayoutAttr::unwrap_start_indent)
+        self.inner
+            .get_layout(LayoutAttr::START_INDENT)
+            .map(LayoutAttr::unwrap_start_indent)
     }
 
     /// Set the spacing between the start inline edge of the element and the parent.
     pub fn set_start_indent(&mut self, start_indent: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::START_INDENT, start_indent.map(LayoutAttr::StartIndent));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::START_INDENT,
+            start_indent.map(LayoutAttr::StartIndent),
+        );
     }
 
     /// Set the spacing between the start inline edge of the element and the parent.
@@ -2422,12 +2737,17 @@ impl Tag<kind::LI> {
 
     /// The spacing between the end inline edge of the element and the parent.
     pub fn end_indent(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::END_INDENT).map(LayoutAttr::unwrap_end_indent)
+        self.inner
+            .get_layout(LayoutAttr::END_INDENT)
+            .map(LayoutAttr::unwrap_end_indent)
     }
 
     /// Set the spacing between the end inline edge of the element and the parent.
     pub fn set_end_indent(&mut self, end_indent: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::END_INDENT, end_indent.map(LayoutAttr::EndIndent));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::END_INDENT,
+            end_indent.map(LayoutAttr::EndIndent),
+        );
     }
 
     /// Set the spacing between the end inline edge of the element and the parent.
@@ -2439,13 +2759,18 @@ impl Tag<kind::LI> {
     /// The amount the first line of text in a block-level element is indented. Only
     /// applicable to paragraph-like elements with non-block-level elements.
     pub fn text_indent(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::TEXT_INDENT).map(LayoutAttr::unwrap_text_indent)
+        self.inner
+            .get_layout(LayoutAttr::TEXT_INDENT)
+            .map(LayoutAttr::unwrap_text_indent)
     }
 
     /// Set the amount the first line of text in a block-level element is indented. Only
     /// applicable to paragraph-like elements with non-block-level elements.
     pub fn set_text_indent(&mut self, text_indent: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::TEXT_INDENT, text_indent.map(LayoutAttr::TextIndent));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::TEXT_INDENT,
+            text_indent.map(LayoutAttr::TextIndent),
+        );
     }
 
     /// Set the amount the first line of text in a block-level element is indented. Only
@@ -2457,12 +2782,17 @@ impl Tag<kind::LI> {
 
     /// The text alignment.
     pub fn text_align(&self) -> Option<TextAlign> {
-        self.inner.get_layout(LayoutAttr::TEXT_ALIGN).map(LayoutAttr::unwrap_text_align)
+        self.inner
+            .get_layout(LayoutAttr::TEXT_ALIGN)
+            .map(LayoutAttr::unwrap_text_align)
     }
 
     /// Set the text alignment.
     pub fn set_text_align(&mut self, text_align: Option<TextAlign>) {
-        self.inner.set_or_remove_layout(LayoutAttr::TEXT_ALIGN, text_align.map(LayoutAttr::TextAlign));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::TEXT_ALIGN,
+            text_align.map(LayoutAttr::TextAlign),
+        );
     }
 
     /// Set the text alignment.
@@ -2472,11 +2802,7 @@ impl Tag<kind::LI> {
     }
 }
 
-impl From<Tag<kind::Lbl>> for TagKind {
-    fn from(value: Tag<kind::Lbl>) -> Self {
-        Self::Lbl(value)
-    }
-}
+impl_from_tag!(Lbl);
 impl Tag<kind::Lbl> {
     /// Label for a list item.
     #[allow(non_upper_case_globals)]
@@ -2484,12 +2810,17 @@ impl Tag<kind::Lbl> {
 
     /// The spacing before the block-level element.
     pub fn space_before(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::SPACE_BEFORE).map(LayoutAttr::unwrap_space_before)
+        self.inner
+            .get_layout(LayoutAttr::SPACE_BEFORE)
+            .map(LayoutAttr::unwrap_space_before)
     }
 
     /// Set the spacing before the block-level element.
     pub fn set_space_before(&mut self, space_before: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::SPACE_BEFORE, space_before.map(LayoutAttr::SpaceBefore));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::SPACE_BEFORE,
+            space_before.map(LayoutAttr::SpaceBefore),
+        );
     }
 
     /// Set the spacing before the block-level element.
@@ -2500,12 +2831,17 @@ impl Tag<kind::Lbl> {
 
     /// The spacing after the block-level element.
     pub fn space_after(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::SPACE_AFTER).map(LayoutAttr::unwrap_space_after)
+        self.inner
+            .get_layout(LayoutAttr::SPACE_AFTER)
+            .map(LayoutAttr::unwrap_space_after)
     }
 
     /// Set the spacing after the block-level element.
     pub fn set_space_after(&mut self, space_after: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::SPACE_AFTER, space_after.map(LayoutAttr::SpaceAfter));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::SPACE_AFTER,
+            space_after.map(LayoutAttr::SpaceAfter),
+        );
     }
 
     /// Set the spacing after the block-level element.
@@ -2516,12 +2852,17 @@ impl Tag<kind::Lbl> {
 
     /// The spacing between the start inline edge of the element and the parent.
     pub fn start_indent(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::START_INDENT).map(LayoutAttr::unwrap_start_indent)
+        self.inner
+            .get_layout(LayoutAttr::START_INDENT)
+            .map(LayoutAttr::unwrap_start_indent)
     }
 
     /// Set the spacing between the start inline edge of the element and the parent.
     pub fn set_start_indent(&mut self, start_indent: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::START_INDENT, start_indent.map(LayoutAttr::StartIndent));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::START_INDENT,
+            start_indent.map(LayoutAttr::StartIndent),
+        );
     }
 
     /// Set the spacing between the start inline edge of the element and the parent.
@@ -2532,12 +2873,17 @@ impl Tag<kind::Lbl> {
 
     /// The spacing between the end inline edge of the element and the parent.
     pub fn end_indent(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::END_INDENT).map(LayoutAttr::unwrap_end_indent)
+        self.inner
+            .get_layout(LayoutAttr::END_INDENT)
+            .map(LayoutAttr::unwrap_end_indent)
     }
 
     /// Set the spacing between the end inline edge of the element and the parent.
     pub fn set_end_indent(&mut self, end_indent: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::END_INDENT, end_indent.map(LayoutAttr::EndIndent));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::END_INDENT,
+            end_indent.map(LayoutAttr::EndIndent),
+        );
     }
 
     /// Set the spacing between the end inline edge of the element and the parent.
@@ -2549,13 +2895,18 @@ impl Tag<kind::Lbl> {
     /// The amount the first line of text in a block-level element is indented. Only
     /// applicable to paragraph-like elements with non-block-level elements.
     pub fn text_indent(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::TEXT_INDENT).map(LayoutAttr::unwrap_text_indent)
+        self.inner
+            .get_layout(LayoutAttr::TEXT_INDENT)
+            .map(LayoutAttr::unwrap_text_indent)
     }
 
     /// Set the amount the first line of text in a block-level element is indented. Only
     /// applicable to paragraph-like elements with non-block-level elements.
     pub fn set_text_indent(&mut self, text_indent: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::TEXT_INDENT, text_indent.map(LayoutAttr::TextIndent));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::TEXT_INDENT,
+            text_indent.map(LayoutAttr::TextIndent),
+        );
     }
 
     /// Set the amount the first line of text in a block-level element is indented. Only
@@ -2567,12 +2918,17 @@ impl Tag<kind::Lbl> {
 
     /// The text alignment.
     pub fn text_align(&self) -> Option<TextAlign> {
-        self.inner.get_layout(LayoutAttr::TEXT_ALIGN).map(LayoutAttr::unwrap_text_align)
+        self.inner
+            .get_layout(LayoutAttr::TEXT_ALIGN)
+            .map(LayoutAttr::unwrap_text_align)
     }
 
     /// Set the text alignment.
     pub fn set_text_align(&mut self, text_align: Option<TextAlign>) {
-        self.inner.set_or_remove_layout(LayoutAttr::TEXT_ALIGN, text_align.map(LayoutAttr::TextAlign));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::TEXT_ALIGN,
+            text_align.map(LayoutAttr::TextAlign),
+        );
     }
 
     /// Set the text alignment.
@@ -2582,11 +2938,7 @@ impl Tag<kind::Lbl> {
     }
 }
 
-impl From<Tag<kind::LBody>> for TagKind {
-    fn from(value: Tag<kind::LBody>) -> Self {
-        Self::LBody(value)
-    }
-}
+impl_from_tag!(LBody);
 impl Tag<kind::LBody> {
     /// Description of the list item.
     #[allow(non_upper_case_globals)]
@@ -2594,12 +2946,17 @@ impl Tag<kind::LBody> {
 
     /// The spacing before the block-level element.
     pub fn space_before(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::SPACE_BEFORE).map(LayoutAttr::unwrap_space_before)
+        self.inner
+            .get_layout(LayoutAttr::SPACE_BEFORE)
+            .map(LayoutAttr::unwrap_space_before)
     }
 
     /// Set the spacing before the block-level element.
     pub fn set_space_before(&mut self, space_before: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::SPACE_BEFORE, space_before.map(LayoutAttr::SpaceBefore));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::SPACE_BEFORE,
+            space_before.map(LayoutAttr::SpaceBefore),
+        );
     }
 
     /// Set the spacing before the block-level element.
@@ -2610,12 +2967,17 @@ impl Tag<kind::LBody> {
 
     /// The spacing after the block-level element.
     pub fn space_after(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::SPACE_AFTER).map(LayoutAttr::unwrap_space_after)
+        self.inner
+            .get_layout(LayoutAttr::SPACE_AFTER)
+            .map(LayoutAttr::unwrap_space_after)
     }
 
     /// Set the spacing after the block-level element.
     pub fn set_space_after(&mut self, space_after: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::SPACE_AFTER, space_after.map(LayoutAttr::SpaceAfter));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::SPACE_AFTER,
+            space_after.map(LayoutAttr::SpaceAfter),
+        );
     }
 
     /// Set the spacing after the block-level element.
@@ -2626,12 +2988,17 @@ impl Tag<kind::LBody> {
 
     /// The spacing between the start inline edge of the element and the parent.
     pub fn start_indent(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::START_INDENT).map(LayoutAttr::unwrap_start_indent)
+        self.inner
+            .get_layout(LayoutAttr::START_INDENT)
+            .map(LayoutAttr::unwrap_start_indent)
     }
 
     /// Set the spacing between the start inline edge of the element and the parent.
     pub fn set_start_indent(&mut self, start_indent: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::START_INDENT, start_indent.map(LayoutAttr::StartIndent));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::START_INDENT,
+            start_indent.map(LayoutAttr::StartIndent),
+        );
     }
 
     /// Set the spacing between the start inline edge of the element and the parent.
@@ -2642,12 +3009,17 @@ impl Tag<kind::LBody> {
 
     /// The spacing between the end inline edge of the element and the parent.
     pub fn end_indent(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::END_INDENT).map(LayoutAttr::unwrap_end_indent)
+        self.inner
+            .get_layout(LayoutAttr::END_INDENT)
+            .map(LayoutAttr::unwrap_end_indent)
     }
 
     /// Set the spacing between the end inline edge of the element and the parent.
     pub fn set_end_indent(&mut self, end_indent: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::END_INDENT, end_indent.map(LayoutAttr::EndIndent));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::END_INDENT,
+            end_indent.map(LayoutAttr::EndIndent),
+        );
     }
 
     /// Set the spacing between the end inline edge of the element and the parent.
@@ -2659,13 +3031,18 @@ impl Tag<kind::LBody> {
     /// The amount the first line of text in a block-level element is indented. Only
     /// applicable to paragraph-like elements with non-block-level elements.
     pub fn text_indent(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::TEXT_INDENT).map(LayoutAttr::unwrap_text_indent)
+        self.inner
+            .get_layout(LayoutAttr::TEXT_INDENT)
+            .map(LayoutAttr::unwrap_text_indent)
     }
 
     /// Set the amount the first line of text in a block-level element is indented. Only
     /// applicable to paragraph-like elements with non-block-level elements.
     pub fn set_text_indent(&mut self, text_indent: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::TEXT_INDENT, text_indent.map(LayoutAttr::TextIndent));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::TEXT_INDENT,
+            text_indent.map(LayoutAttr::TextIndent),
+        );
     }
 
     /// Set the amount the first line of text in a block-level element is indented. Only
@@ -2677,12 +3054,17 @@ impl Tag<kind::LBody> {
 
     /// The text alignment.
     pub fn text_align(&self) -> Option<TextAlign> {
-        self.inner.get_layout(LayoutAttr::TEXT_ALIGN).map(LayoutAttr::unwrap_text_align)
+        self.inner
+            .get_layout(LayoutAttr::TEXT_ALIGN)
+            .map(LayoutAttr::unwrap_text_align)
     }
 
     /// Set the text alignment.
     pub fn set_text_align(&mut self, text_align: Option<TextAlign>) {
-        self.inner.set_or_remove_layout(LayoutAttr::TEXT_ALIGN, text_align.map(LayoutAttr::TextAlign));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::TEXT_ALIGN,
+            text_align.map(LayoutAttr::TextAlign),
+        );
     }
 
     /// Set the text alignment.
@@ -2692,11 +3074,7 @@ impl Tag<kind::LBody> {
     }
 }
 
-impl From<Tag<kind::Table>> for TagKind {
-    fn from(value: Tag<kind::Table>) -> Self {
-        Self::Table(value)
-    }
-}
+impl_from_tag!(Table);
 impl Tag<kind::Table> {
     /// A table, with an optional summary describing the purpose and structure.
     ///
@@ -2708,12 +3086,15 @@ impl Tag<kind::Table> {
 
     /// The table summary.
     pub fn summary(&self) -> Option<&str> {
-        self.inner.get_table(TableAttr::SUMMARY).map(TableAttr::unwrap_summary)
+        self.inner
+            .get_table(TableAttr::SUMMARY)
+            .map(TableAttr::unwrap_summary)
     }
 
     /// Set the table summary.
     pub fn set_summary(&mut self, summary: Option<String>) {
-        self.inner.set_or_remove_table(TableAttr::SUMMARY, summary.map(TableAttr::Summary));
+        self.inner
+            .set_or_remove_table(TableAttr::SUMMARY, summary.map(TableAttr::Summary));
     }
 
     /// Set the table summary.
@@ -2725,13 +3106,16 @@ impl Tag<kind::Table> {
     /// The bounding box of a tag that encloses its visible content.
     /// If the content spans multiple pages, this should be omitted.
     pub fn bbox(&self) -> Option<BBox> {
-        self.inner.get_layout(LayoutAttr::B_BOX).map(LayoutAttr::unwrap_bbox)
+        self.inner
+            .get_layout(LayoutAttr::B_BOX)
+            .map(LayoutAttr::unwrap_bbox)
     }
 
     /// Set the bounding box of a tag that encloses its visible content.
     /// If the content spans multiple pages, this should be omitted.
     pub fn set_bbox(&mut self, bbox: Option<BBox>) {
-        self.inner.set_or_remove_layout(LayoutAttr::B_BOX, bbox.map(LayoutAttr::BBox));
+        self.inner
+            .set_or_remove_layout(LayoutAttr::B_BOX, bbox.map(LayoutAttr::BBox));
     }
 
     /// Set the bounding box of a tag that encloses its visible content.
@@ -2743,12 +3127,15 @@ impl Tag<kind::Table> {
 
     /// The width.
     pub fn width(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::WIDTH).map(LayoutAttr::unwrap_width)
+        self.inner
+            .get_layout(LayoutAttr::WIDTH)
+            .map(LayoutAttr::unwrap_width)
     }
 
     /// Set the width.
     pub fn set_width(&mut self, width: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::WIDTH, width.map(LayoutAttr::Width));
+        self.inner
+            .set_or_remove_layout(LayoutAttr::WIDTH, width.map(LayoutAttr::Width));
     }
 
     /// Set the width.
@@ -2759,12 +3146,15 @@ impl Tag<kind::Table> {
 
     /// The height.
     pub fn height(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::HEIGHT).map(LayoutAttr::unwrap_height)
+        self.inner
+            .get_layout(LayoutAttr::HEIGHT)
+            .map(LayoutAttr::unwrap_height)
     }
 
     /// Set the height.
     pub fn set_height(&mut self, height: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::HEIGHT, height.map(LayoutAttr::Height));
+        self.inner
+            .set_or_remove_layout(LayoutAttr::HEIGHT, height.map(LayoutAttr::Height));
     }
 
     /// Set the height.
@@ -2775,12 +3165,17 @@ impl Tag<kind::Table> {
 
     /// The spacing before the block-level element.
     pub fn space_before(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::SPACE_BEFORE).map(LayoutAttr::unwrap_space_before)
+        self.inner
+            .get_layout(LayoutAttr::SPACE_BEFORE)
+            .map(LayoutAttr::unwrap_space_before)
     }
 
     /// Set the spacing before the block-level element.
     pub fn set_space_before(&mut self, space_before: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::SPACE_BEFORE, space_before.map(LayoutAttr::SpaceBefore));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::SPACE_BEFORE,
+            space_before.map(LayoutAttr::SpaceBefore),
+        );
     }
 
     /// Set the spacing before the block-level element.
@@ -2791,12 +3186,17 @@ impl Tag<kind::Table> {
 
     /// The spacing after the block-level element.
     pub fn space_after(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::SPACE_AFTER).map(LayoutAttr::unwrap_space_after)
+        self.inner
+            .get_layout(LayoutAttr::SPACE_AFTER)
+            .map(LayoutAttr::unwrap_space_after)
     }
 
     /// Set the spacing after the block-level element.
     pub fn set_space_after(&mut self, space_after: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::SPACE_AFTER, space_after.map(LayoutAttr::SpaceAfter));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::SPACE_AFTER,
+            space_after.map(LayoutAttr::SpaceAfter),
+        );
     }
 
     /// Set the spacing after the block-level element.
@@ -2807,12 +3207,17 @@ impl Tag<kind::Table> {
 
     /// The spacing between the start inline edge of the element and the parent.
     pub fn start_indent(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::START_INDENT).map(LayoutAttr::unwrap_start_indent)
+        self.inner
+            .get_layout(LayoutAttr::START_INDENT)
+            .map(LayoutAttr::unwrap_start_indent)
     }
 
     /// Set the spacing between the start inline edge of the element and the parent.
     pub fn set_start_indent(&mut self, start_indent: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::START_INDENT, start_indent.map(LayoutAttr::StartIndent));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::START_INDENT,
+            start_indent.map(LayoutAttr::StartIndent),
+        );
     }
 
     /// Set the spacing between the start inline edge of the element and the parent.
@@ -2823,12 +3228,17 @@ impl Tag<kind::Table> {
 
     /// The spacing between the end inline edge of the element and the parent.
     pub fn end_indent(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::END_INDENT).map(LayoutAttr::unwrap_end_indent)
+        self.inner
+            .get_layout(LayoutAttr::END_INDENT)
+            .map(LayoutAttr::unwrap_end_indent)
     }
 
     /// Set the spacing between the end inline edge of the element and the parent.
     pub fn set_end_indent(&mut self, end_indent: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::END_INDENT, end_indent.map(LayoutAttr::EndIndent));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::END_INDENT,
+            end_indent.map(LayoutAttr::EndIndent),
+        );
     }
 
     /// Set the spacing between the end inline edge of the element and the parent.
@@ -2840,13 +3250,18 @@ impl Tag<kind::Table> {
     /// The amount the first line of text in a block-level element is indented. Only
     /// applicable to paragraph-like elements with non-block-level elements.
     pub fn text_indent(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::TEXT_INDENT).map(LayoutAttr::unwrap_text_indent)
+        self.inner
+            .get_layout(LayoutAttr::TEXT_INDENT)
+            .map(LayoutAttr::unwrap_text_indent)
     }
 
     /// Set the amount the first line of text in a block-level element is indented. Only
     /// applicable to paragraph-like elements with non-block-level elements.
     pub fn set_text_indent(&mut self, text_indent: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::TEXT_INDENT, text_indent.map(LayoutAttr::TextIndent));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::TEXT_INDENT,
+            text_indent.map(LayoutAttr::TextIndent),
+        );
     }
 
     /// Set the amount the first line of text in a block-level element is indented. Only
@@ -2858,12 +3273,17 @@ impl Tag<kind::Table> {
 
     /// The text alignment.
     pub fn text_align(&self) -> Option<TextAlign> {
-        self.inner.get_layout(LayoutAttr::TEXT_ALIGN).map(LayoutAttr::unwrap_text_align)
+        self.inner
+            .get_layout(LayoutAttr::TEXT_ALIGN)
+            .map(LayoutAttr::unwrap_text_align)
     }
 
     /// Set the text alignment.
     pub fn set_text_align(&mut self, text_align: Option<TextAlign>) {
-        self.inner.set_or_remove_layout(LayoutAttr::TEXT_ALIGN, text_align.map(LayoutAttr::TextAlign));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::TEXT_ALIGN,
+            text_align.map(LayoutAttr::TextAlign),
+        );
     }
 
     /// Set the text alignment.
@@ -2873,11 +3293,7 @@ impl Tag<kind::Table> {
     }
 }
 
-impl From<Tag<kind::TR>> for TagKind {
-    fn from(value: Tag<kind::TR>) -> Self {
-        Self::TR(value)
-    }
-}
+impl_from_tag!(TR);
 impl Tag<kind::TR> {
     /// A table row.
     ///
@@ -2886,11 +3302,7 @@ impl Tag<kind::TR> {
     pub const TR: Tag<kind::TR> = Tag::new();
 }
 
-impl From<Tag<kind::TH>> for TagKind {
-    fn from(value: Tag<kind::TH>) -> Self {
-        Self::TH(value)
-    }
-}
+impl_from_tag!(TH);
 impl Tag<kind::TH> {
     /// A table header cell.
     #[allow(non_snake_case)]
@@ -2902,7 +3314,10 @@ impl Tag<kind::TH> {
 
     /// The table header scope.
     pub fn scope(&self) -> TableHeaderScope {
-        self.inner.get_table(TableAttr::HEADER_SCOPE).unwrap().unwrap_scope()
+        self.inner
+            .get_table(TableAttr::HEADER_SCOPE)
+            .unwrap()
+            .unwrap_scope()
     }
 
     /// Set the table header scope.
@@ -2924,7 +3339,9 @@ impl Tag<kind::TH> {
     ///
     /// This allows specifying header hierarchies inside tables.
     pub fn headers(&self) -> Option<&[TagId]> {
-        self.inner.get_table(TableAttr::CELL_HEADERS).map(TableAttr::unwrap_headers)
+        self.inner
+            .get_table(TableAttr::CELL_HEADERS)
+            .map(TableAttr::unwrap_headers)
     }
 
     /// Set the list of headers associated with a table cell.
@@ -2935,7 +3352,12 @@ impl Tag<kind::TH> {
     ///
     /// This allows specifying header hierarchies inside tables.
     pub fn set_headers(&mut self, headers: Option<impl IntoIterator<Item = TagId>>) {
-        self.inner.set_or_remove_table(TableAttr::CELL_HEADERS, headers.map(|ids| ids.into_iter().collect()).map(TableAttr::CellHeaders));
+        self.inner.set_or_remove_table(
+            TableAttr::CELL_HEADERS,
+            headers
+                .map(|ids| ids.into_iter().collect())
+                .map(TableAttr::CellHeaders),
+        );
     }
 
     /// Set the list of headers associated with a table cell.
@@ -2952,12 +3374,15 @@ impl Tag<kind::TH> {
 
     /// The row span of this table cell.
     pub fn row_span(&self) -> Option<NonZeroU32> {
-        self.inner.get_table(TableAttr::ROW_SPAN).map(TableAttr::unwrap_row_span)
+        self.inner
+            .get_table(TableAttr::ROW_SPAN)
+            .map(TableAttr::unwrap_row_span)
     }
 
     /// Set the row span of this table cell.
     pub fn set_row_span(&mut self, row_span: Option<NonZeroU32>) {
-        self.inner.set_or_remove_table(TableAttr::ROW_SPAN, row_span.map(TableAttr::RowSpan));
+        self.inner
+            .set_or_remove_table(TableAttr::ROW_SPAN, row_span.map(TableAttr::RowSpan));
     }
 
     /// Set the row span of this table cell.
@@ -2968,12 +3393,15 @@ impl Tag<kind::TH> {
 
     /// The column span of this table cell.
     pub fn col_span(&self) -> Option<NonZeroU32> {
-        self.inner.get_table(TableAttr::COL_SPAN).map(TableAttr::unwrap_col_span)
+        self.inner
+            .get_table(TableAttr::COL_SPAN)
+            .map(TableAttr::unwrap_col_span)
     }
 
     /// Set the column span of this table cell.
     pub fn set_col_span(&mut self, col_span: Option<NonZeroU32>) {
-        self.inner.set_or_remove_table(TableAttr::COL_SPAN, col_span.map(TableAttr::ColSpan));
+        self.inner
+            .set_or_remove_table(TableAttr::COL_SPAN, col_span.map(TableAttr::ColSpan));
     }
 
     /// Set the column span of this table cell.
@@ -2984,12 +3412,15 @@ impl Tag<kind::TH> {
 
     /// The width.
     pub fn width(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::WIDTH).map(LayoutAttr::unwrap_width)
+        self.inner
+            .get_layout(LayoutAttr::WIDTH)
+            .map(LayoutAttr::unwrap_width)
     }
 
     /// Set the width.
     pub fn set_width(&mut self, width: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::WIDTH, width.map(LayoutAttr::Width));
+        self.inner
+            .set_or_remove_layout(LayoutAttr::WIDTH, width.map(LayoutAttr::Width));
     }
 
     /// Set the width.
@@ -3000,12 +3431,15 @@ impl Tag<kind::TH> {
 
     /// The height.
     pub fn height(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::HEIGHT).map(LayoutAttr::unwrap_height)
+        self.inner
+            .get_layout(LayoutAttr::HEIGHT)
+            .map(LayoutAttr::unwrap_height)
     }
 
     /// Set the height.
     pub fn set_height(&mut self, height: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::HEIGHT, height.map(LayoutAttr::Height));
+        self.inner
+            .set_or_remove_layout(LayoutAttr::HEIGHT, height.map(LayoutAttr::Height));
     }
 
     /// Set the height.
@@ -3016,28 +3450,41 @@ impl Tag<kind::TH> {
 
     /// The border style of table cells, overriding `BorderStyle`.
     pub fn table_border_style(&self) -> Option<Sides<BorderStyle>> {
-        self.inner.get_layout(LayoutAttr::TABLE_BORDER_STYLE).map(LayoutAttr::unwrap_table_border_style)
+        self.inner
+            .get_layout(LayoutAttr::TABLE_BORDER_STYLE)
+            .map(LayoutAttr::unwrap_table_border_style)
     }
 
     /// Set the border style of table cells, overriding `BorderStyle`.
     pub fn set_table_border_style(&mut self, table_border_style: Option<Sides<BorderStyle>>) {
-        self.inner.set_or_remove_layout(LayoutAttr::TABLE_BORDER_STYLE, table_border_style.map(LayoutAttr::TableBorderStyle));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::TABLE_BORDER_STYLE,
+            table_border_style.map(LayoutAttr::TableBorderStyle),
+        );
     }
 
     /// Set the border style of table cells, overriding `BorderStyle`.
-    pub fn with_table_border_style(mut self, table_border_style: Option<Sides<BorderStyle>>) -> Self {
+    pub fn with_table_border_style(
+        mut self,
+        table_border_style: Option<Sides<BorderStyle>>,
+    ) -> Self {
         self.set_table_border_style(table_border_style);
         self
     }
 
     /// The padding inside of table cells, overriding `Padding`.
     pub fn table_padding(&self) -> Option<Sides<f32>> {
-        self.inner.get_layout(LayoutAttr::TABLE_PADDING).map(LayoutAttr::unwrap_table_padding)
+        self.inner
+            .get_layout(LayoutAttr::TABLE_PADDING)
+            .map(LayoutAttr::unwrap_table_padding)
     }
 
     /// Set the padding inside of table cells, overriding `Padding`.
     pub fn set_table_padding(&mut self, table_padding: Option<Sides<f32>>) {
-        self.inner.set_or_remove_layout(LayoutAttr::TABLE_PADDING, table_padding.map(LayoutAttr::TablePadding));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::TABLE_PADDING,
+            table_padding.map(LayoutAttr::TablePadding),
+        );
     }
 
     /// Set the padding inside of table cells, overriding `Padding`.
@@ -3048,12 +3495,17 @@ impl Tag<kind::TH> {
 
     /// The alignment of block-level elements inside of this block-level element.
     pub fn block_align(&self) -> Option<BlockAlign> {
-        self.inner.get_layout(LayoutAttr::BLOCK_ALIGN).map(LayoutAttr::unwrap_block_align)
+        self.inner
+            .get_layout(LayoutAttr::BLOCK_ALIGN)
+            .map(LayoutAttr::unwrap_block_align)
     }
 
     /// Set the alignment of block-level elements inside of this block-level element.
     pub fn set_block_align(&mut self, block_align: Option<BlockAlign>) {
-        self.inner.set_or_remove_layout(LayoutAttr::BLOCK_ALIGN, block_align.map(LayoutAttr::BlockAlign));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::BLOCK_ALIGN,
+            block_align.map(LayoutAttr::BlockAlign),
+        );
     }
 
     /// Set the alignment of block-level elements inside of this block-level element.
@@ -3064,12 +3516,17 @@ impl Tag<kind::TH> {
 
     /// The alignment of inline-level elements inside of this block-level element.
     pub fn inline_align(&self) -> Option<InlineAlign> {
-        self.inner.get_layout(LayoutAttr::INLINE_ALIGN).map(LayoutAttr::unwrap_inline_align)
+        self.inner
+            .get_layout(LayoutAttr::INLINE_ALIGN)
+            .map(LayoutAttr::unwrap_inline_align)
     }
 
     /// Set the alignment of inline-level elements inside of this block-level element.
     pub fn set_inline_align(&mut self, inline_align: Option<InlineAlign>) {
-        self.inner.set_or_remove_layout(LayoutAttr::INLINE_ALIGN, inline_align.map(LayoutAttr::InlineAlign));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::INLINE_ALIGN,
+            inline_align.map(LayoutAttr::InlineAlign),
+        );
     }
 
     /// Set the alignment of inline-level elements inside of this block-level element.
@@ -3079,11 +3536,7 @@ impl Tag<kind::TH> {
     }
 }
 
-impl From<Tag<kind::TD>> for TagKind {
-    fn from(value: Tag<kind::TD>) -> Self {
-        Self::TD(value)
-    }
-}
+impl_from_tag!(TD);
 impl Tag<kind::TD> {
     /// A table data cell.
     #[allow(non_upper_case_globals)]
@@ -3097,7 +3550,9 @@ impl Tag<kind::TD> {
     ///
     /// This allows specifying header hierarchies inside tables.
     pub fn headers(&self) -> Option<&[TagId]> {
-        self.inner.get_table(TableAttr::CELL_HEADERS).map(TableAttr::unwrap_headers)
+        self.inner
+            .get_table(TableAttr::CELL_HEADERS)
+            .map(TableAttr::unwrap_headers)
     }
 
     /// Set the list of headers associated with a table cell.
@@ -3108,7 +3563,12 @@ impl Tag<kind::TD> {
     ///
     /// This allows specifying header hierarchies inside tables.
     pub fn set_headers(&mut self, headers: Option<impl IntoIterator<Item = TagId>>) {
-        self.inner.set_or_remove_table(TableAttr::CELL_HEADERS, headers.map(|ids| ids.into_iter().collect()).map(TableAttr::CellHeaders));
+        self.inner.set_or_remove_table(
+            TableAttr::CELL_HEADERS,
+            headers
+                .map(|ids| ids.into_iter().collect())
+                .map(TableAttr::CellHeaders),
+        );
     }
 
     /// Set the list of headers associated with a table cell.
@@ -3125,12 +3585,15 @@ impl Tag<kind::TD> {
 
     /// The row span of this table cell.
     pub fn row_span(&self) -> Option<NonZeroU32> {
-        self.inner.get_table(TableAttr::ROW_SPAN).map(TableAttr::unwrap_row_span)
+        self.inner
+            .get_table(TableAttr::ROW_SPAN)
+            .map(TableAttr::unwrap_row_span)
     }
 
     /// Set the row span of this table cell.
     pub fn set_row_span(&mut self, row_span: Option<NonZeroU32>) {
-        self.inner.set_or_remove_table(TableAttr::ROW_SPAN, row_span.map(TableAttr::RowSpan));
+        self.inner
+            .set_or_remove_table(TableAttr::ROW_SPAN, row_span.map(TableAttr::RowSpan));
     }
 
     /// Set the row span of this table cell.
@@ -3141,12 +3604,15 @@ impl Tag<kind::TD> {
 
     /// The column span of this table cell.
     pub fn col_span(&self) -> Option<NonZeroU32> {
-        self.inner.get_table(TableAttr::COL_SPAN).map(TableAttr::unwrap_col_span)
+        self.inner
+            .get_table(TableAttr::COL_SPAN)
+            .map(TableAttr::unwrap_col_span)
     }
 
     /// Set the column span of this table cell.
     pub fn set_col_span(&mut self, col_span: Option<NonZeroU32>) {
-        self.inner.set_or_remove_table(TableAttr::COL_SPAN, col_span.map(TableAttr::ColSpan));
+        self.inner
+            .set_or_remove_table(TableAttr::COL_SPAN, col_span.map(TableAttr::ColSpan));
     }
 
     /// Set the column span of this table cell.
@@ -3157,12 +3623,15 @@ impl Tag<kind::TD> {
 
     /// The width.
     pub fn width(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::WIDTH).map(LayoutAttr::unwrap_width)
+        self.inner
+            .get_layout(LayoutAttr::WIDTH)
+            .map(LayoutAttr::unwrap_width)
     }
 
     /// Set the width.
     pub fn set_width(&mut self, width: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::WIDTH, width.map(LayoutAttr::Width));
+        self.inner
+            .set_or_remove_layout(LayoutAttr::WIDTH, width.map(LayoutAttr::Width));
     }
 
     /// Set the width.
@@ -3173,12 +3642,15 @@ impl Tag<kind::TD> {
 
     /// The height.
     pub fn height(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::HEIGHT).map(LayoutAttr::unwrap_height)
+        self.inner
+            .get_layout(LayoutAttr::HEIGHT)
+            .map(LayoutAttr::unwrap_height)
     }
 
     /// Set the height.
     pub fn set_height(&mut self, height: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::HEIGHT, height.map(LayoutAttr::Height));
+        self.inner
+            .set_or_remove_layout(LayoutAttr::HEIGHT, height.map(LayoutAttr::Height));
     }
 
     /// Set the height.
@@ -3189,28 +3661,41 @@ impl Tag<kind::TD> {
 
     /// The border style of table cells, overriding `BorderStyle`.
     pub fn table_border_style(&self) -> Option<Sides<BorderStyle>> {
-        self.inner.get_layout(LayoutAttr::TABLE_BORDER_STYLE).map(LayoutAttr::unwrap_table_border_style)
+        self.inner
+            .get_layout(LayoutAttr::TABLE_BORDER_STYLE)
+            .map(LayoutAttr::unwrap_table_border_style)
     }
 
     /// Set the border style of table cells, overriding `BorderStyle`.
     pub fn set_table_border_style(&mut self, table_border_style: Option<Sides<BorderStyle>>) {
-        self.inner.set_or_remove_layout(LayoutAttr::TABLE_BORDER_STYLE, table_border_style.map(LayoutAttr::TableBorderStyle));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::TABLE_BORDER_STYLE,
+            table_border_style.map(LayoutAttr::TableBorderStyle),
+        );
     }
 
     /// Set the border style of table cells, overriding `BorderStyle`.
-    pub fn with_table_border_style(mut self, table_border_style: Option<Sides<BorderStyle>>) -> Self {
+    pub fn with_table_border_style(
+        mut self,
+        table_border_style: Option<Sides<BorderStyle>>,
+    ) -> Self {
         self.set_table_border_style(table_border_style);
         self
     }
 
     /// The padding inside of table cells, overriding `Padding`.
     pub fn table_padding(&self) -> Option<Sides<f32>> {
-        self.inner.get_layout(LayoutAttr::TABLE_PADDING).map(LayoutAttr::unwrap_table_padding)
+        self.inner
+            .get_layout(LayoutAttr::TABLE_PADDING)
+            .map(LayoutAttr::unwrap_table_padding)
     }
 
     /// Set the padding inside of table cells, overriding `Padding`.
     pub fn set_table_padding(&mut self, table_padding: Option<Sides<f32>>) {
-        self.inner.set_or_remove_layout(LayoutAttr::TABLE_PADDING, table_padding.map(LayoutAttr::TablePadding));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::TABLE_PADDING,
+            table_padding.map(LayoutAttr::TablePadding),
+        );
     }
 
     /// Set the padding inside of table cells, overriding `Padding`.
@@ -3221,12 +3706,17 @@ impl Tag<kind::TD> {
 
     /// The alignment of block-level elements inside of this block-level element.
     pub fn block_align(&self) -> Option<BlockAlign> {
-        self.inner.get_layout(LayoutAttr::BLOCK_ALIGN).map(LayoutAttr::unwrap_block_align)
+        self.inner
+            .get_layout(LayoutAttr::BLOCK_ALIGN)
+            .map(LayoutAttr::unwrap_block_align)
     }
 
     /// Set the alignment of block-level elements inside of this block-level element.
     pub fn set_block_align(&mut self, block_align: Option<BlockAlign>) {
-        self.inner.set_or_remove_layout(LayoutAttr::BLOCK_ALIGN, block_align.map(LayoutAttr::BlockAlign));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::BLOCK_ALIGN,
+            block_align.map(LayoutAttr::BlockAlign),
+        );
     }
 
     /// Set the alignment of block-level elements inside of this block-level element.
@@ -3237,12 +3727,17 @@ impl Tag<kind::TD> {
 
     /// The alignment of inline-level elements inside of this block-level element.
     pub fn inline_align(&self) -> Option<InlineAlign> {
-        self.inner.get_layout(LayoutAttr::INLINE_ALIGN).map(LayoutAttr::unwrap_inline_align)
+        self.inner
+            .get_layout(LayoutAttr::INLINE_ALIGN)
+            .map(LayoutAttr::unwrap_inline_align)
     }
 
     /// Set the alignment of inline-level elements inside of this block-level element.
     pub fn set_inline_align(&mut self, inline_align: Option<InlineAlign>) {
-        self.inner.set_or_remove_layout(LayoutAttr::INLINE_ALIGN, inline_align.map(LayoutAttr::InlineAlign));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::INLINE_ALIGN,
+            inline_align.map(LayoutAttr::InlineAlign),
+        );
     }
 
     /// Set the alignment of inline-level elements inside of this block-level element.
@@ -3252,44 +3747,28 @@ impl Tag<kind::TD> {
     }
 }
 
-impl From<Tag<kind::THead>> for TagKind {
-    fn from(value: Tag<kind::THead>) -> Self {
-        Self::THead(value)
-    }
-}
+impl_from_tag!(THead);
 impl Tag<kind::THead> {
     /// A table header row group.
     #[allow(non_upper_case_globals)]
     pub const THead: Tag<kind::THead> = Tag::new();
 }
 
-impl From<Tag<kind::TBody>> for TagKind {
-    fn from(value: Tag<kind::TBody>) -> Self {
-        Self::TBody(value)
-    }
-}
+impl_from_tag!(TBody);
 impl Tag<kind::TBody> {
     /// A table data row group.
     #[allow(non_upper_case_globals)]
     pub const TBody: Tag<kind::TBody> = Tag::new();
 }
 
-impl From<Tag<kind::TFoot>> for TagKind {
-    fn from(value: Tag<kind::TFoot>) -> Self {
-        Self::TFoot(value)
-    }
-}
+impl_from_tag!(TFoot);
 impl Tag<kind::TFoot> {
     /// A table footer row group.
     #[allow(non_upper_case_globals)]
     pub const TFoot: Tag<kind::TFoot> = Tag::new();
 }
 
-impl From<Tag<kind::Span>> for TagKind {
-    fn from(value: Tag<kind::Span>) -> Self {
-        Self::Span(value)
-    }
-}
+impl_from_tag!(Span);
 impl Tag<kind::Span> {
     /// An inline-level element that does not have a specific meaning.
     #[allow(non_upper_case_globals)]
@@ -3297,12 +3776,17 @@ impl Tag<kind::Span> {
 
     /// The spacing before the block-level element.
     pub fn space_before(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::SPACE_BEFORE).map(LayoutAttr::unwrap_space_before)
+        self.inner
+            .get_layout(LayoutAttr::SPACE_BEFORE)
+            .map(LayoutAttr::unwrap_space_before)
     }
 
     /// Set the spacing before the block-level element.
     pub fn set_space_before(&mut self, space_before: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::SPACE_BEFORE, space_before.map(LayoutAttr::SpaceBefore));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::SPACE_BEFORE,
+            space_before.map(LayoutAttr::SpaceBefore),
+        );
     }
 
     /// Set the spacing before the block-level element.
@@ -3313,12 +3797,17 @@ impl Tag<kind::Span> {
 
     /// The spacing after the block-level element.
     pub fn space_after(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::SPACE_AFTER).map(LayoutAttr::unwrap_space_after)
+        self.inner
+            .get_layout(LayoutAttr::SPACE_AFTER)
+            .map(LayoutAttr::unwrap_space_after)
     }
 
     /// Set the spacing after the block-level element.
     pub fn set_space_after(&mut self, space_after: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::SPACE_AFTER, space_after.map(LayoutAttr::SpaceAfter));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::SPACE_AFTER,
+            space_after.map(LayoutAttr::SpaceAfter),
+        );
     }
 
     /// Set the spacing after the block-level element.
@@ -3329,12 +3818,17 @@ impl Tag<kind::Span> {
 
     /// The spacing between the start inline edge of the element and the parent.
     pub fn start_indent(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::START_INDENT).map(LayoutAttr::unwrap_start_indent)
+        self.inner
+            .get_layout(LayoutAttr::START_INDENT)
+            .map(LayoutAttr::unwrap_start_indent)
     }
 
     /// Set the spacing between the start inline edge of the element and the parent.
     pub fn set_start_indent(&mut self, start_indent: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::START_INDENT, start_indent.map(LayoutAttr::StartIndent));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::START_INDENT,
+            start_indent.map(LayoutAttr::StartIndent),
+        );
     }
 
     /// Set the spacing between the start inline edge of the element and the parent.
@@ -3345,12 +3839,17 @@ impl Tag<kind::Span> {
 
     /// The spacing between the end inline edge of the element and the parent.
     pub fn end_indent(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::END_INDENT).map(LayoutAttr::unwrap_end_indent)
+        self.inner
+            .get_layout(LayoutAttr::END_INDENT)
+            .map(LayoutAttr::unwrap_end_indent)
     }
 
     /// Set the spacing between the end inline edge of the element and the parent.
     pub fn set_end_indent(&mut self, end_indent: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::END_INDENT, end_indent.map(LayoutAttr::EndIndent));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::END_INDENT,
+            end_indent.map(LayoutAttr::EndIndent),
+        );
     }
 
     /// Set the spacing between the end inline edge of the element and the parent.
@@ -3360,11 +3859,7 @@ impl Tag<kind::Span> {
     }
 }
 
-impl From<Tag<kind::InlineQuote>> for TagKind {
-    fn from(value: Tag<kind::InlineQuote>) -> Self {
-        Self::InlineQuote(value)
-    }
-}
+impl_from_tag!(InlineQuote);
 impl Tag<kind::InlineQuote> {
     /// An inline quotation.
     #[allow(non_upper_case_globals)]
@@ -3372,12 +3867,17 @@ impl Tag<kind::InlineQuote> {
 
     /// The spacing before the block-level element.
     pub fn space_before(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::SPACE_BEFORE).map(LayoutAttr::unwrap_space_before)
+        self.inner
+            .get_layout(LayoutAttr::SPACE_BEFORE)
+            .map(LayoutAttr::unwrap_space_before)
     }
 
     /// Set the spacing before the block-level element.
     pub fn set_space_before(&mut self, space_before: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::SPACE_BEFORE, space_before.map(LayoutAttr::SpaceBefore));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::SPACE_BEFORE,
+            space_before.map(LayoutAttr::SpaceBefore),
+        );
     }
 
     /// Set the spacing before the block-level element.
@@ -3388,12 +3888,17 @@ impl Tag<kind::InlineQuote> {
 
     /// The spacing after the block-level element.
     pub fn space_after(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::SPACE_AFTER).map(LayoutAttr::unwrap_space_after)
+        self.inner
+            .get_layout(LayoutAttr::SPACE_AFTER)
+            .map(LayoutAttr::unwrap_space_after)
     }
 
     /// Set the spacing after the block-level element.
     pub fn set_space_after(&mut self, space_after: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::SPACE_AFTER, space_after.map(LayoutAttr::SpaceAfter));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::SPACE_AFTER,
+            space_after.map(LayoutAttr::SpaceAfter),
+        );
     }
 
     /// Set the spacing after the block-level element.
@@ -3404,12 +3909,17 @@ impl Tag<kind::InlineQuote> {
 
     /// The spacing between the start inline edge of the element and the parent.
     pub fn start_indent(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::START_INDENT).map(LayoutAttr::unwrap_start_indent)
+        self.inner
+            .get_layout(LayoutAttr::START_INDENT)
+            .map(LayoutAttr::unwrap_start_indent)
     }
 
     /// Set the spacing between the start inline edge of the element and the parent.
     pub fn set_start_indent(&mut self, start_indent: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::START_INDENT, start_indent.map(LayoutAttr::StartIndent));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::START_INDENT,
+            start_indent.map(LayoutAttr::StartIndent),
+        );
     }
 
     /// Set the spacing between the start inline edge of the element and the parent.
@@ -3420,12 +3930,17 @@ impl Tag<kind::InlineQuote> {
 
     /// The spacing between the end inline edge of the element and the parent.
     pub fn end_indent(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::END_INDENT).map(LayoutAttr::unwrap_end_indent)
+        self.inner
+            .get_layout(LayoutAttr::END_INDENT)
+            .map(LayoutAttr::unwrap_end_indent)
     }
 
     /// Set the spacing between the end inline edge of the element and the parent.
     pub fn set_end_indent(&mut self, end_indent: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::END_INDENT, end_indent.map(LayoutAttr::EndIndent));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::END_INDENT,
+            end_indent.map(LayoutAttr::EndIndent),
+        );
     }
 
     /// Set the spacing between the end inline edge of the element and the parent.
@@ -3435,11 +3950,7 @@ impl Tag<kind::InlineQuote> {
     }
 }
 
-impl From<Tag<kind::Note>> for TagKind {
-    fn from(value: Tag<kind::Note>) -> Self {
-        Self::Note(value)
-    }
-}
+impl_from_tag!(Note);
 impl Tag<kind::Note> {
     /// A foot- or endnote, potentially referred to from within the text.
     ///
@@ -3449,12 +3960,17 @@ impl Tag<kind::Note> {
 
     /// The spacing before the block-level element.
     pub fn space_before(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::SPACE_BEFORE).map(LayoutAttr::unwrap_space_before)
+        self.inner
+            .get_layout(LayoutAttr::SPACE_BEFORE)
+            .map(LayoutAttr::unwrap_space_before)
     }
 
     /// Set the spacing before the block-level element.
     pub fn set_space_before(&mut self, space_before: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::SPACE_BEFORE, space_before.map(LayoutAttr::SpaceBefore));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::SPACE_BEFORE,
+            space_before.map(LayoutAttr::SpaceBefore),
+        );
     }
 
     /// Set the spacing before the block-level element.
@@ -3465,12 +3981,17 @@ impl Tag<kind::Note> {
 
     /// The spacing after the block-level element.
     pub fn space_after(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::SPACE_AFTER).map(LayoutAttr::unwrap_space_after)
+        self.inner
+            .get_layout(LayoutAttr::SPACE_AFTER)
+            .map(LayoutAttr::unwrap_space_after)
     }
 
     /// Set the spacing after the block-level element.
     pub fn set_space_after(&mut self, space_after: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::SPACE_AFTER, space_after.map(LayoutAttr::SpaceAfter));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::SPACE_AFTER,
+            space_after.map(LayoutAttr::SpaceAfter),
+        );
     }
 
     /// Set the spacing after the block-level element.
@@ -3481,12 +4002,17 @@ impl Tag<kind::Note> {
 
     /// The spacing between the start inline edge of the element and the parent.
     pub fn start_indent(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::START_INDENT).map(LayoutAttr::unwrap_start_indent)
+        self.inner
+            .get_layout(LayoutAttr::START_INDENT)
+            .map(LayoutAttr::unwrap_start_indent)
     }
 
     /// Set the spacing between the start inline edge of the element and the parent.
     pub fn set_start_indent(&mut self, start_indent: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::START_INDENT, start_indent.map(LayoutAttr::StartIndent));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::START_INDENT,
+            start_indent.map(LayoutAttr::StartIndent),
+        );
     }
 
     /// Set the spacing between the start inline edge of the element and the parent.
@@ -3497,12 +4023,17 @@ impl Tag<kind::Note> {
 
     /// The spacing between the end inline edge of the element and the parent.
     pub fn end_indent(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::END_INDENT).map(LayoutAttr::unwrap_end_indent)
+        self.inner
+            .get_layout(LayoutAttr::END_INDENT)
+            .map(LayoutAttr::unwrap_end_indent)
     }
 
     /// Set the spacing between the end inline edge of the element and the parent.
     pub fn set_end_indent(&mut self, end_indent: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::END_INDENT, end_indent.map(LayoutAttr::EndIndent));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::END_INDENT,
+            end_indent.map(LayoutAttr::EndIndent),
+        );
     }
 
     /// Set the spacing between the end inline edge of the element and the parent.
@@ -3512,11 +4043,7 @@ impl Tag<kind::Note> {
     }
 }
 
-impl From<Tag<kind::Reference>> for TagKind {
-    fn from(value: Tag<kind::Reference>) -> Self {
-        Self::Reference(value)
-    }
-}
+impl_from_tag!(Reference);
 impl Tag<kind::Reference> {
     /// A reference to elsewhere in the document.
     ///
@@ -3528,12 +4055,17 @@ impl Tag<kind::Reference> {
 
     /// The spacing before the block-level element.
     pub fn space_before(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::SPACE_BEFORE).map(LayoutAttr::unwrap_space_before)
+        self.inner
+            .get_layout(LayoutAttr::SPACE_BEFORE)
+            .map(LayoutAttr::unwrap_space_before)
     }
 
     /// Set the spacing before the block-level element.
     pub fn set_space_before(&mut self, space_before: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::SPACE_BEFORE, space_before.map(LayoutAttr::SpaceBefore));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::SPACE_BEFORE,
+            space_before.map(LayoutAttr::SpaceBefore),
+        );
     }
 
     /// Set the spacing before the block-level element.
@@ -3544,12 +4076,17 @@ impl Tag<kind::Reference> {
 
     /// The spacing after the block-level element.
     pub fn space_after(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::SPACE_AFTER).map(LayoutAttr::unwrap_space_after)
+        self.inner
+            .get_layout(LayoutAttr::SPACE_AFTER)
+            .map(LayoutAttr::unwrap_space_after)
     }
 
     /// Set the spacing after the block-level element.
     pub fn set_space_after(&mut self, space_after: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::SPACE_AFTER, space_after.map(LayoutAttr::SpaceAfter));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::SPACE_AFTER,
+            space_after.map(LayoutAttr::SpaceAfter),
+        );
     }
 
     /// Set the spacing after the block-level element.
@@ -3560,12 +4097,17 @@ impl Tag<kind::Reference> {
 
     /// The spacing between the start inline edge of the element and the parent.
     pub fn start_indent(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::START_INDENT).map(LayoutAttr::unwrap_start_indent)
+        self.inner
+            .get_layout(LayoutAttr::START_INDENT)
+            .map(LayoutAttr::unwrap_start_indent)
     }
 
     /// Set the spacing between the start inline edge of the element and the parent.
     pub fn set_start_indent(&mut self, start_indent: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::START_INDENT, start_indent.map(LayoutAttr::StartIndent));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::START_INDENT,
+            start_indent.map(LayoutAttr::StartIndent),
+        );
     }
 
     /// Set the spacing between the start inline edge of the element and the parent.
@@ -3576,12 +4118,17 @@ impl Tag<kind::Reference> {
 
     /// The spacing between the end inline edge of the element and the parent.
     pub fn end_indent(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::END_INDENT).map(LayoutAttr::unwrap_end_indent)
+        self.inner
+            .get_layout(LayoutAttr::END_INDENT)
+            .map(LayoutAttr::unwrap_end_indent)
     }
 
     /// Set the spacing between the end inline edge of the element and the parent.
     pub fn set_end_indent(&mut self, end_indent: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::END_INDENT, end_indent.map(LayoutAttr::EndIndent));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::END_INDENT,
+            end_indent.map(LayoutAttr::EndIndent),
+        );
     }
 
     /// Set the spacing between the end inline edge of the element and the parent.
@@ -3591,11 +4138,7 @@ impl Tag<kind::Reference> {
     }
 }
 
-impl From<Tag<kind::BibEntry>> for TagKind {
-    fn from(value: Tag<kind::BibEntry>) -> Self {
-        Self::BibEntry(value)
-    }
-}
+impl_from_tag!(BibEntry);
 impl Tag<kind::BibEntry> {
     /// A reference to the external source of some cited document.
     ///
@@ -3605,12 +4148,17 @@ impl Tag<kind::BibEntry> {
 
     /// The spacing before the block-level element.
     pub fn space_before(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::SPACE_BEFORE).map(LayoutAttr::unwrap_space_before)
+        self.inner
+            .get_layout(LayoutAttr::SPACE_BEFORE)
+            .map(LayoutAttr::unwrap_space_before)
     }
 
     /// Set the spacing before the block-level element.
     pub fn set_space_before(&mut self, space_before: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::SPACE_BEFORE, space_before.map(LayoutAttr::SpaceBefore));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::SPACE_BEFORE,
+            space_before.map(LayoutAttr::SpaceBefore),
+        );
     }
 
     /// Set the spacing before the block-level element.
@@ -3621,12 +4169,17 @@ impl Tag<kind::BibEntry> {
 
     /// The spacing after the block-level element.
     pub fn space_after(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::SPACE_AFTER).map(LayoutAttr::unwrap_space_after)
+        self.inner
+            .get_layout(LayoutAttr::SPACE_AFTER)
+            .map(LayoutAttr::unwrap_space_after)
     }
 
     /// Set the spacing after the block-level element.
     pub fn set_space_after(&mut self, space_after: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::SPACE_AFTER, space_after.map(LayoutAttr::SpaceAfter));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::SPACE_AFTER,
+            space_after.map(LayoutAttr::SpaceAfter),
+        );
     }
 
     /// Set the spacing after the block-level element.
@@ -3637,12 +4190,17 @@ impl Tag<kind::BibEntry> {
 
     /// The spacing between the start inline edge of the element and the parent.
     pub fn start_indent(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::START_INDENT).map(LayoutAttr::unwrap_start_indent)
+        self.inner
+            .get_layout(LayoutAttr::START_INDENT)
+            .map(LayoutAttr::unwrap_start_indent)
     }
 
     /// Set the spacing between the start inline edge of the element and the parent.
     pub fn set_start_indent(&mut self, start_indent: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::START_INDENT, start_indent.map(LayoutAttr::StartIndent));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::START_INDENT,
+            start_indent.map(LayoutAttr::StartIndent),
+        );
     }
 
     /// Set the spacing between the start inline edge of the element and the parent.
@@ -3653,12 +4211,17 @@ impl Tag<kind::BibEntry> {
 
     /// The spacing between the end inline edge of the element and the parent.
     pub fn end_indent(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::END_INDENT).map(LayoutAttr::unwrap_end_indent)
+        self.inner
+            .get_layout(LayoutAttr::END_INDENT)
+            .map(LayoutAttr::unwrap_end_indent)
     }
 
     /// Set the spacing between the end inline edge of the element and the parent.
     pub fn set_end_indent(&mut self, end_indent: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::END_INDENT, end_indent.map(LayoutAttr::EndIndent));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::END_INDENT,
+            end_indent.map(LayoutAttr::EndIndent),
+        );
     }
 
     /// Set the spacing between the end inline edge of the element and the parent.
@@ -3668,11 +4231,7 @@ impl Tag<kind::BibEntry> {
     }
 }
 
-impl From<Tag<kind::Code>> for TagKind {
-    fn from(value: Tag<kind::Code>) -> Self {
-        Self::Code(value)
-    }
-}
+impl_from_tag!(Code);
 impl Tag<kind::Code> {
     /// Computer code.
     #[allow(non_upper_case_globals)]
@@ -3680,12 +4239,17 @@ impl Tag<kind::Code> {
 
     /// The spacing before the block-level element.
     pub fn space_before(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::SPACE_BEFORE).map(LayoutAttr::unwrap_space_before)
+        self.inner
+            .get_layout(LayoutAttr::SPACE_BEFORE)
+            .map(LayoutAttr::unwrap_space_before)
     }
 
     /// Set the spacing before the block-level element.
     pub fn set_space_before(&mut self, space_before: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::SPACE_BEFORE, space_before.map(LayoutAttr::SpaceBefore));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::SPACE_BEFORE,
+            space_before.map(LayoutAttr::SpaceBefore),
+        );
     }
 
     /// Set the spacing before the block-level element.
@@ -3696,12 +4260,17 @@ impl Tag<kind::Code> {
 
     /// The spacing after the block-level element.
     pub fn space_after(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::SPACE_AFTER).map(LayoutAttr::unwrap_space_after)
+        self.inner
+            .get_layout(LayoutAttr::SPACE_AFTER)
+            .map(LayoutAttr::unwrap_space_after)
     }
 
     /// Set the spacing after the block-level element.
     pub fn set_space_after(&mut self, space_after: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::SPACE_AFTER, space_after.map(LayoutAttr::SpaceAfter));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::SPACE_AFTER,
+            space_after.map(LayoutAttr::SpaceAfter),
+        );
     }
 
     /// Set the spacing after the block-level element.
@@ -3712,12 +4281,17 @@ impl Tag<kind::Code> {
 
     /// The spacing between the start inline edge of the element and the parent.
     pub fn start_indent(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::START_INDENT).map(LayoutAttr::unwrap_start_indent)
+        self.inner
+            .get_layout(LayoutAttr::START_INDENT)
+            .map(LayoutAttr::unwrap_start_indent)
     }
 
     /// Set the spacing between the start inline edge of the element and the parent.
     pub fn set_start_indent(&mut self, start_indent: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::START_INDENT, start_indent.map(LayoutAttr::StartIndent));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::START_INDENT,
+            start_indent.map(LayoutAttr::StartIndent),
+        );
     }
 
     /// Set the spacing between the start inline edge of the element and the parent.
@@ -3728,12 +4302,17 @@ impl Tag<kind::Code> {
 
     /// The spacing between the end inline edge of the element and the parent.
     pub fn end_indent(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::END_INDENT).map(LayoutAttr::unwrap_end_indent)
+        self.inner
+            .get_layout(LayoutAttr::END_INDENT)
+            .map(LayoutAttr::unwrap_end_indent)
     }
 
     /// Set the spacing between the end inline edge of the element and the parent.
     pub fn set_end_indent(&mut self, end_indent: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::END_INDENT, end_indent.map(LayoutAttr::EndIndent));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::END_INDENT,
+            end_indent.map(LayoutAttr::EndIndent),
+        );
     }
 
     /// Set the spacing between the end inline edge of the element and the parent.
@@ -3743,11 +4322,7 @@ impl Tag<kind::Code> {
     }
 }
 
-impl From<Tag<kind::Link>> for TagKind {
-    fn from(value: Tag<kind::Link>) -> Self {
-        Self::Link(value)
-    }
-}
+impl_from_tag!(Link);
 impl Tag<kind::Link> {
     /// A link.
     ///
@@ -3759,12 +4334,17 @@ impl Tag<kind::Link> {
 
     /// The spacing before the block-level element.
     pub fn space_before(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::SPACE_BEFORE).map(LayoutAttr::unwrap_space_before)
+        self.inner
+            .get_layout(LayoutAttr::SPACE_BEFORE)
+            .map(LayoutAttr::unwrap_space_before)
     }
 
     /// Set the spacing before the block-level element.
     pub fn set_space_before(&mut self, space_before: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::SPACE_BEFORE, space_before.map(LayoutAttr::SpaceBefore));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::SPACE_BEFORE,
+            space_before.map(LayoutAttr::SpaceBefore),
+        );
     }
 
     /// Set the spacing before the block-level element.
@@ -3775,12 +4355,17 @@ impl Tag<kind::Link> {
 
     /// The spacing after the block-level element.
     pub fn space_after(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::SPACE_AFTER).map(LayoutAttr::unwrap_space_after)
+        self.inner
+            .get_layout(LayoutAttr::SPACE_AFTER)
+            .map(LayoutAttr::unwrap_space_after)
     }
 
     /// Set the spacing after the block-level element.
     pub fn set_space_after(&mut self, space_after: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::SPACE_AFTER, space_after.map(LayoutAttr::SpaceAfter));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::SPACE_AFTER,
+            space_after.map(LayoutAttr::SpaceAfter),
+        );
     }
 
     /// Set the spacing after the block-level element.
@@ -3791,12 +4376,17 @@ impl Tag<kind::Link> {
 
     /// The spacing between the start inline edge of the element and the parent.
     pub fn start_indent(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::START_INDENT).map(LayoutAttr::unwrap_start_indent)
+        self.inner
+            .get_layout(LayoutAttr::START_INDENT)
+            .map(LayoutAttr::unwrap_start_indent)
     }
 
     /// Set the spacing between the start inline edge of the element and the parent.
     pub fn set_start_indent(&mut self, start_indent: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::START_INDENT, start_indent.map(LayoutAttr::StartIndent));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::START_INDENT,
+            start_indent.map(LayoutAttr::StartIndent),
+        );
     }
 
     /// Set the spacing between the start inline edge of the element and the parent.
@@ -3807,12 +4397,17 @@ impl Tag<kind::Link> {
 
     /// The spacing between the end inline edge of the element and the parent.
     pub fn end_indent(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::END_INDENT).map(LayoutAttr::unwrap_end_indent)
+        self.inner
+            .get_layout(LayoutAttr::END_INDENT)
+            .map(LayoutAttr::unwrap_end_indent)
     }
 
     /// Set the spacing between the end inline edge of the element and the parent.
     pub fn set_end_indent(&mut self, end_indent: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::END_INDENT, end_indent.map(LayoutAttr::EndIndent));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::END_INDENT,
+            end_indent.map(LayoutAttr::EndIndent),
+        );
     }
 
     /// Set the spacing between the end inline edge of the element and the parent.
@@ -3822,11 +4417,7 @@ impl Tag<kind::Link> {
     }
 }
 
-impl From<Tag<kind::Annot>> for TagKind {
-    fn from(value: Tag<kind::Annot>) -> Self {
-        Self::Annot(value)
-    }
-}
+impl_from_tag!(Annot);
 impl Tag<kind::Annot> {
     /// An association between an annotation and the content it belongs to. PDF
     ///
@@ -3839,12 +4430,17 @@ impl Tag<kind::Annot> {
 
     /// The spacing before the block-level element.
     pub fn space_before(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::SPACE_BEFORE).map(LayoutAttr::unwrap_space_before)
+        self.inner
+            .get_layout(LayoutAttr::SPACE_BEFORE)
+            .map(LayoutAttr::unwrap_space_before)
     }
 
     /// Set the spacing before the block-level element.
     pub fn set_space_before(&mut self, space_before: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::SPACE_BEFORE, space_before.map(LayoutAttr::SpaceBefore));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::SPACE_BEFORE,
+            space_before.map(LayoutAttr::SpaceBefore),
+        );
     }
 
     /// Set the spacing before the block-level element.
@@ -3855,12 +4451,17 @@ impl Tag<kind::Annot> {
 
     /// The spacing after the block-level element.
     pub fn space_after(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::SPACE_AFTER).map(LayoutAttr::unwrap_space_after)
+        self.inner
+            .get_layout(LayoutAttr::SPACE_AFTER)
+            .map(LayoutAttr::unwrap_space_after)
     }
 
     /// Set the spacing after the block-level element.
     pub fn set_space_after(&mut self, space_after: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::SPACE_AFTER, space_after.map(LayoutAttr::SpaceAfter));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::SPACE_AFTER,
+            space_after.map(LayoutAttr::SpaceAfter),
+        );
     }
 
     /// Set the spacing after the block-level element.
@@ -3871,12 +4472,17 @@ impl Tag<kind::Annot> {
 
     /// The spacing between the start inline edge of the element and the parent.
     pub fn start_indent(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::START_INDENT).map(LayoutAttr::unwrap_start_indent)
+        self.inner
+            .get_layout(LayoutAttr::START_INDENT)
+            .map(LayoutAttr::unwrap_start_indent)
     }
 
     /// Set the spacing between the start inline edge of the element and the parent.
     pub fn set_start_indent(&mut self, start_indent: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::START_INDENT, start_indent.map(LayoutAttr::StartIndent));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::START_INDENT,
+            start_indent.map(LayoutAttr::StartIndent),
+        );
     }
 
     /// Set the spacing between the start inline edge of the element and the parent.
@@ -3887,12 +4493,17 @@ impl Tag<kind::Annot> {
 
     /// The spacing between the end inline edge of the element and the parent.
     pub fn end_indent(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::END_INDENT).map(LayoutAttr::unwrap_end_indent)
+        self.inner
+            .get_layout(LayoutAttr::END_INDENT)
+            .map(LayoutAttr::unwrap_end_indent)
     }
 
     /// Set the spacing between the end inline edge of the element and the parent.
     pub fn set_end_indent(&mut self, end_indent: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::END_INDENT, end_indent.map(LayoutAttr::EndIndent));
+        self.inner.set_or_remove_layout(
+            LayoutAttr::END_INDENT,
+            end_indent.map(LayoutAttr::EndIndent),
+        );
     }
 
     /// Set the spacing between the end inline edge of the element and the parent.
@@ -3902,11 +4513,7 @@ impl Tag<kind::Annot> {
     }
 }
 
-impl From<Tag<kind::Figure>> for TagKind {
-    fn from(value: Tag<kind::Figure>) -> Self {
-        Self::Figure(value)
-    }
-}
+impl_from_tag!(Figure);
 impl Tag<kind::Figure> {
     /// Item of graphical content.
     ///
@@ -3921,13 +4528,16 @@ impl Tag<kind::Figure> {
     /// The bounding box of a tag that encloses its visible content.
     /// If the content spans multiple pages, this should be omitted.
     pub fn bbox(&self) -> Option<BBox> {
-        self.inner.get_layout(LayoutAttr::B_BOX).map(LayoutAttr::unwrap_bbox)
+        self.inner
+            .get_layout(LayoutAttr::B_BOX)
+            .map(LayoutAttr::unwrap_bbox)
     }
 
     /// Set the bounding box of a tag that encloses its visible content.
     /// If the content spans multiple pages, this should be omitted.
     pub fn set_bbox(&mut self, bbox: Option<BBox>) {
-        self.inner.set_or_remove_layout(LayoutAttr::B_BOX, bbox.map(LayoutAttr::BBox));
+        self.inner
+            .set_or_remove_layout(LayoutAttr::B_BOX, bbox.map(LayoutAttr::BBox));
     }
 
     /// Set the bounding box of a tag that encloses its visible content.
@@ -3939,12 +4549,15 @@ impl Tag<kind::Figure> {
 
     /// The width.
     pub fn width(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::WIDTH).map(LayoutAttr::unwrap_width)
+        self.inner
+            .get_layout(LayoutAttr::WIDTH)
+            .map(LayoutAttr::unwrap_width)
     }
 
     /// Set the width.
     pub fn set_width(&mut self, width: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::WIDTH, width.map(LayoutAttr::Width));
+        self.inner
+            .set_or_remove_layout(LayoutAttr::WIDTH, width.map(LayoutAttr::Width));
     }
 
     /// Set the width.
@@ -3955,12 +4568,15 @@ impl Tag<kind::Figure> {
 
     /// The height.
     pub fn height(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::HEIGHT).map(LayoutAttr::unwrap_height)
+        self.inner
+            .get_layout(LayoutAttr::HEIGHT)
+            .map(LayoutAttr::unwrap_height)
     }
 
     /// Set the height.
     pub fn set_height(&mut self, height: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::HEIGHT, height.map(LayoutAttr::Height));
+        self.inner
+            .set_or_remove_layout(LayoutAttr::HEIGHT, height.map(LayoutAttr::Height));
     }
 
     /// Set the height.
@@ -3970,11 +4586,7 @@ impl Tag<kind::Figure> {
     }
 }
 
-impl From<Tag<kind::Formula>> for TagKind {
-    fn from(value: Tag<kind::Formula>) -> Self {
-        Self::Formula(value)
-    }
-}
+impl_from_tag!(Formula);
 impl Tag<kind::Formula> {
     /// A mathematical formula.
     ///
@@ -3989,13 +4601,16 @@ impl Tag<kind::Formula> {
     /// The bounding box of a tag that encloses its visible content.
     /// If the content spans multiple pages, this should be omitted.
     pub fn bbox(&self) -> Option<BBox> {
-        self.inner.get_layout(LayoutAttr::B_BOX).map(LayoutAttr::unwrap_bbox)
+        self.inner
+            .get_layout(LayoutAttr::B_BOX)
+            .map(LayoutAttr::unwrap_bbox)
     }
 
     /// Set the bounding box of a tag that encloses its visible content.
     /// If the content spans multiple pages, this should be omitted.
     pub fn set_bbox(&mut self, bbox: Option<BBox>) {
-        self.inner.set_or_remove_layout(LayoutAttr::B_BOX, bbox.map(LayoutAttr::BBox));
+        self.inner
+            .set_or_remove_layout(LayoutAttr::B_BOX, bbox.map(LayoutAttr::BBox));
     }
 
     /// Set the bounding box of a tag that encloses its visible content.
@@ -4007,12 +4622,15 @@ impl Tag<kind::Formula> {
 
     /// The width.
     pub fn width(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::WIDTH).map(LayoutAttr::unwrap_width)
+        self.inner
+            .get_layout(LayoutAttr::WIDTH)
+            .map(LayoutAttr::unwrap_width)
     }
 
     /// Set the width.
     pub fn set_width(&mut self, width: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::WIDTH, width.map(LayoutAttr::Width));
+        self.inner
+            .set_or_remove_layout(LayoutAttr::WIDTH, width.map(LayoutAttr::Width));
     }
 
     /// Set the width.
@@ -4023,12 +4641,15 @@ impl Tag<kind::Formula> {
 
     /// The height.
     pub fn height(&self) -> Option<f32> {
-        self.inner.get_layout(LayoutAttr::HEIGHT).map(LayoutAttr::unwrap_height)
+        self.inner
+            .get_layout(LayoutAttr::HEIGHT)
+            .map(LayoutAttr::unwrap_height)
     }
 
     /// Set the height.
     pub fn set_height(&mut self, height: Option<f32>) {
-        self.inner.set_or_remove_layout(LayoutAttr::HEIGHT, height.map(LayoutAttr::Height));
+        self.inner
+            .set_or_remove_layout(LayoutAttr::HEIGHT, height.map(LayoutAttr::Height));
     }
 
     /// Set the height.
@@ -4038,22 +4659,14 @@ impl Tag<kind::Formula> {
     }
 }
 
-impl From<Tag<kind::Form>> for TagKind {
-    fn from(value: Tag<kind::Form>) -> Self {
-        Self::Form(value)
-    }
-}
+impl_from_tag!(Form);
 impl Tag<kind::Form> {
     /// An interactive form field.
     #[allow(non_upper_case_globals)]
     pub const Form: Tag<kind::Form> = Tag::new();
 }
 
-impl From<Tag<kind::NonStruct>> for TagKind {
-    fn from(value: Tag<kind::NonStruct>) -> Self {
-        Self::NonStruct(value)
-    }
-}
+impl_from_tag!(NonStruct);
 impl Tag<kind::NonStruct> {
     /// Non-structural element. A grouping element having no inherent structural significance;
     /// it serves solely for grouping purposes.
@@ -4061,55 +4674,35 @@ impl Tag<kind::NonStruct> {
     pub const NonStruct: Tag<kind::NonStruct> = Tag::new();
 }
 
-impl From<Tag<kind::Datetime>> for TagKind {
-    fn from(value: Tag<kind::Datetime>) -> Self {
-        Self::Datetime(value)
-    }
-}
+impl_from_tag!(Datetime);
 impl Tag<kind::Datetime> {
     /// A date or time.
     #[allow(non_upper_case_globals)]
     pub const Datetime: Tag<kind::Datetime> = Tag::new();
 }
 
-impl From<Tag<kind::Terms>> for TagKind {
-    fn from(value: Tag<kind::Terms>) -> Self {
-        Self::Terms(value)
-    }
-}
+impl_from_tag!(Terms);
 impl Tag<kind::Terms> {
     /// A list of terms.
     #[allow(non_upper_case_globals)]
     pub const Terms: Tag<kind::Terms> = Tag::new();
 }
 
-impl From<Tag<kind::Title>> for TagKind {
-    fn from(value: Tag<kind::Title>) -> Self {
-        Self::Title(value)
-    }
-}
+impl_from_tag!(Title);
 impl Tag<kind::Title> {
     /// A title.
     #[allow(non_upper_case_globals)]
     pub const Title: Tag<kind::Title> = Tag::new();
 }
 
-impl From<Tag<kind::Strong>> for TagKind {
-    fn from(value: Tag<kind::Strong>) -> Self {
-        Self::Strong(value)
-    }
-}
+impl_from_tag!(Strong);
 impl Tag<kind::Strong> {
     /// Encloses content with strong importance, most commonly **bold** text.
     #[allow(non_upper_case_globals)]
     pub const Strong: Tag<kind::Strong> = Tag::new();
 }
 
-impl From<Tag<kind::Em>> for TagKind {
-    fn from(value: Tag<kind::Em>) -> Self {
-        Self::Em(value)
-    }
-}
+impl_from_tag!(Em);
 impl Tag<kind::Em> {
     /// Encloses content that is emphasized, most commonly *italic* text.
     #[allow(non_upper_case_globals)]
@@ -4125,38 +4718,37 @@ pub(crate) enum Attr {
 }
 
 impl Attr {
-
-        #[inline(always)]
-        fn unwrap_struct(&self) -> &StructAttr {
-            match self {
-                Self::Struct(attr) => attr,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_struct(&self) -> &StructAttr {
+        match self {
+            Self::Struct(attr) => attr,
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_list(&self) -> &ListAttr {
-            match self {
-                Self::List(attr) => attr,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_list(&self) -> &ListAttr {
+        match self {
+            Self::List(attr) => attr,
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_table(&self) -> &TableAttr {
-            match self {
-                Self::Table(attr) => attr,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_table(&self) -> &TableAttr {
+        match self {
+            Self::Table(attr) => attr,
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_layout(&self) -> &LayoutAttr {
-            match self {
-                Self::Layout(attr) => attr,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_layout(&self) -> &LayoutAttr {
+        match self {
+            Self::Layout(attr) => attr,
+            _ => unreachable!(),
         }
+    }
 }
 impl Ordinal for Attr {
     fn ordinal(&self) -> usize {
@@ -4200,61 +4792,61 @@ impl StructAttr {
     pub(crate) const TITLE: usize = 5;
     pub(crate) const HEADING_LEVEL: usize = 6;
 
-        #[inline(always)]
-        fn unwrap_id(&self) -> &TagId {
-            match self {
-                Self::Id(val) => val,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_id(&self) -> &TagId {
+        match self {
+            Self::Id(val) => val,
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_lang(&self) -> &str {
-            match self {
-                Self::Lang(val) => val.as_ref(),
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_lang(&self) -> &str {
+        match self {
+            Self::Lang(val) => val.as_ref(),
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_alt_text(&self) -> &str {
-            match self {
-                Self::AltText(val) => val.as_ref(),
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_alt_text(&self) -> &str {
+        match self {
+            Self::AltText(val) => val.as_ref(),
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_expanded(&self) -> &str {
-            match self {
-                Self::Expanded(val) => val.as_ref(),
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_expanded(&self) -> &str {
+        match self {
+            Self::Expanded(val) => val.as_ref(),
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_actual_text(&self) -> &str {
-            match self {
-                Self::ActualText(val) => val.as_ref(),
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_actual_text(&self) -> &str {
+        match self {
+            Self::ActualText(val) => val.as_ref(),
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_title(&self) -> &str {
-            match self {
-                Self::Title(val) => val.as_ref(),
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_title(&self) -> &str {
+        match self {
+            Self::Title(val) => val.as_ref(),
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_level(&self) -> NonZeroU16 {
-            match self {
-                Self::HeadingLevel(val) => *val,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_level(&self) -> NonZeroU16 {
+        match self {
+            Self::HeadingLevel(val) => *val,
+            _ => unreachable!(),
         }
+    }
 }
 
 impl Ordinal for StructAttr {
@@ -4280,12 +4872,12 @@ pub(crate) enum ListAttr {
 impl ListAttr {
     pub(crate) const NUMBERING: usize = 7;
 
-        #[inline(always)]
-        fn unwrap_numbering(&self) -> ListNumbering {
-            match self {
-                Self::Numbering(val) => *val,
-            }
+    #[inline(always)]
+    fn unwrap_numbering(&self) -> ListNumbering {
+        match self {
+            Self::Numbering(val) => *val,
         }
+    }
 }
 
 impl Ordinal for ListAttr {
@@ -4323,45 +4915,45 @@ impl TableAttr {
     pub(crate) const ROW_SPAN: usize = 11;
     pub(crate) const COL_SPAN: usize = 12;
 
-        #[inline(always)]
-        fn unwrap_summary(&self) -> &str {
-            match self {
-                Self::Summary(val) => val.as_ref(),
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_summary(&self) -> &str {
+        match self {
+            Self::Summary(val) => val.as_ref(),
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_scope(&self) -> TableHeaderScope {
-            match self {
-                Self::HeaderScope(val) => *val,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_scope(&self) -> TableHeaderScope {
+        match self {
+            Self::HeaderScope(val) => *val,
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_headers(&self) -> &[TagId] {
-            match self {
-                Self::CellHeaders(val) => val.as_ref(),
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_headers(&self) -> &[TagId] {
+        match self {
+            Self::CellHeaders(val) => val.as_ref(),
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_row_span(&self) -> NonZeroU32 {
-            match self {
-                Self::RowSpan(val) => *val,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_row_span(&self) -> NonZeroU32 {
+        match self {
+            Self::RowSpan(val) => *val,
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_col_span(&self) -> NonZeroU32 {
-            match self {
-                Self::ColSpan(val) => *val,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_col_span(&self) -> NonZeroU32 {
+        match self {
+            Self::ColSpan(val) => *val,
+            _ => unreachable!(),
         }
+    }
 }
 
 impl Ordinal for TableAttr {
@@ -4474,245 +5066,245 @@ impl LayoutAttr {
     pub(crate) const COLUMN_GAP: usize = 41;
     pub(crate) const COLUMN_WIDTHS: usize = 42;
 
-        #[inline(always)]
-        fn unwrap_placement(&self) -> Placement {
-            match self {
-                Self::Placement(val) => *val,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_placement(&self) -> Placement {
+        match self {
+            Self::Placement(val) => *val,
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_writing_mode(&self) -> WritingMode {
-            match self {
-                Self::WritingMode(val) => *val,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_writing_mode(&self) -> WritingMode {
+        match self {
+            Self::WritingMode(val) => *val,
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_bbox(&self) -> BBox {
-            match self {
-                Self::BBox(val) => *val,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_bbox(&self) -> BBox {
+        match self {
+            Self::BBox(val) => *val,
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_width(&self) -> f32 {
-            match self {
-                Self::Width(val) => *val,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_width(&self) -> f32 {
+        match self {
+            Self::Width(val) => *val,
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_height(&self) -> f32 {
-            match self {
-                Self::Height(val) => *val,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_height(&self) -> f32 {
+        match self {
+            Self::Height(val) => *val,
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_background_color(&self) -> NaiveRgbColor {
-            match self {
-                Self::BackgroundColor(val) => *val,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_background_color(&self) -> NaiveRgbColor {
+        match self {
+            Self::BackgroundColor(val) => *val,
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_border_color(&self) -> Sides<NaiveRgbColor> {
-            match self {
-                Self::BorderColor(val) => *val,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_border_color(&self) -> Sides<NaiveRgbColor> {
+        match self {
+            Self::BorderColor(val) => *val,
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_border_style(&self) -> Sides<BorderStyle> {
-            match self {
-                Self::BorderStyle(val) => *val,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_border_style(&self) -> Sides<BorderStyle> {
+        match self {
+            Self::BorderStyle(val) => *val,
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_border_thickness(&self) -> Sides<f32> {
-            match self {
-                Self::BorderThickness(val) => *val,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_border_thickness(&self) -> Sides<f32> {
+        match self {
+            Self::BorderThickness(val) => *val,
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_padding(&self) -> Sides<f32> {
-            match self {
-                Self::Padding(val) => *val,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_padding(&self) -> Sides<f32> {
+        match self {
+            Self::Padding(val) => *val,
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_color(&self) -> NaiveRgbColor {
-            match self {
-                Self::Color(val) => *val,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_color(&self) -> NaiveRgbColor {
+        match self {
+            Self::Color(val) => *val,
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_space_before(&self) -> f32 {
-            match self {
-                Self::SpaceBefore(val) => *val,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_space_before(&self) -> f32 {
+        match self {
+            Self::SpaceBefore(val) => *val,
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_space_after(&self) -> f32 {
-            match self {
-                Self::SpaceAfter(val) => *val,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_space_after(&self) -> f32 {
+        match self {
+            Self::SpaceAfter(val) => *val,
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_start_indent(&self) -> f32 {
-            match self {
-                Self::StartIndent(val) => *val,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_start_indent(&self) -> f32 {
+        match self {
+            Self::StartIndent(val) => *val,
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_end_indent(&self) -> f32 {
-            match self {
-                Self::EndIndent(val) => *val,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_end_indent(&self) -> f32 {
+        match self {
+            Self::EndIndent(val) => *val,
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_text_indent(&self) -> f32 {
-            match self {
-                Self::TextIndent(val) => *val,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_text_indent(&self) -> f32 {
+        match self {
+            Self::TextIndent(val) => *val,
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_text_align(&self) -> TextAlign {
-            match self {
-                Self::TextAlign(val) => *val,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_text_align(&self) -> TextAlign {
+        match self {
+            Self::TextAlign(val) => *val,
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_block_align(&self) -> BlockAlign {
-            match self {
-                Self::BlockAlign(val) => *val,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_block_align(&self) -> BlockAlign {
+        match self {
+            Self::BlockAlign(val) => *val,
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_inline_align(&self) -> InlineAlign {
-            match self {
-                Self::InlineAlign(val) => *val,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_inline_align(&self) -> InlineAlign {
+        match self {
+            Self::InlineAlign(val) => *val,
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_table_border_style(&self) -> Sides<BorderStyle> {
-            match self {
-                Self::TableBorderStyle(val) => *val,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_table_border_style(&self) -> Sides<BorderStyle> {
+        match self {
+            Self::TableBorderStyle(val) => *val,
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_table_padding(&self) -> Sides<f32> {
-            match self {
-                Self::TablePadding(val) => *val,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_table_padding(&self) -> Sides<f32> {
+        match self {
+            Self::TablePadding(val) => *val,
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_baseline_shift(&self) -> f32 {
-            match self {
-                Self::BaselineShift(val) => *val,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_baseline_shift(&self) -> f32 {
+        match self {
+            Self::BaselineShift(val) => *val,
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_line_height(&self) -> LineHeight {
-            match self {
-                Self::LineHeight(val) => *val,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_line_height(&self) -> LineHeight {
+        match self {
+            Self::LineHeight(val) => *val,
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_text_decoration_color(&self) -> NaiveRgbColor {
-            match self {
-                Self::TextDecorationColor(val) => *val,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_text_decoration_color(&self) -> NaiveRgbColor {
+        match self {
+            Self::TextDecorationColor(val) => *val,
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_text_decoration_thickness(&self) -> f32 {
-            match self {
-                Self::TextDecorationThickness(val) => *val,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_text_decoration_thickness(&self) -> f32 {
+        match self {
+            Self::TextDecorationThickness(val) => *val,
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_text_decoration_type(&self) -> TextDecorationType {
-            match self {
-                Self::TextDecorationType(val) => *val,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_text_decoration_type(&self) -> TextDecorationType {
+        match self {
+            Self::TextDecorationType(val) => *val,
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_glyph_orientation_vertical(&self) -> GlyphOrientationVertical {
-            match self {
-                Self::GlyphOrientationVertical(val) => *val,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_glyph_orientation_vertical(&self) -> GlyphOrientationVertical {
+        match self {
+            Self::GlyphOrientationVertical(val) => *val,
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_column_count(&self) -> NonZeroU32 {
-            match self {
-                Self::ColumnCount(val) => *val,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_column_count(&self) -> NonZeroU32 {
+        match self {
+            Self::ColumnCount(val) => *val,
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_column_gap(&self) -> &ColumnDimensions {
-            match self {
-                Self::ColumnGap(val) => val,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_column_gap(&self) -> &ColumnDimensions {
+        match self {
+            Self::ColumnGap(val) => val,
+            _ => unreachable!(),
         }
+    }
 
-        #[inline(always)]
-        fn unwrap_column_widths(&self) -> &ColumnDimensions {
-            match self {
-                Self::ColumnWidths(val) => val,
-                _ => unreachable!(),
-            }
+    #[inline(always)]
+    fn unwrap_column_widths(&self) -> &ColumnDimensions {
+        match self {
+            Self::ColumnWidths(val) => val,
+            _ => unreachable!(),
         }
+    }
 }
 
 impl Ordinal for LayoutAttr {
@@ -4751,4 +5343,3 @@ impl Ordinal for LayoutAttr {
         }
     }
 }
-
@@ -6,6 +6,18 @@ use smallvec::SmallVec;
 use crate::geom::Rect;
 use crate::surface::Location;
 
+/// Implements `From<Tag<kind::$name>>` for [`TagKind`], used by the generated
+/// code.
+macro_rules! impl_from_tag {
+    ($name:ident) => {
+        impl From<Tag<kind::$name>> for TagKind {
+            fn from(value: Tag<kind::$name>) -> Self {
+                Self::$name(value)
+            }
+        }
+    };
+}
+
 include!("generated.rs");
 
 impl TagKind {